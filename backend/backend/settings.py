@@ -235,6 +235,10 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.AllowAny',  # Changed to allow public access by default
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'backend.renderers.OrjsonRenderer',  # orjson-backed drop-in for JSONRenderer
+        'rest_framework.renderers.BrowsableAPIRenderer',
     )
 }
 
@@ -143,5 +143,6 @@ urlpatterns = [
     path("admin/", include("admin_app.urls")),
     path("chat/", include("chat_app.urls")),
     path("datasets/", include("dataset_app.urls")),
+    path("viz/", include("viz_app.urls")),
     # path("api/jobs/", include("jobs_app.urls")),  # Commented out - Job model not implemented
 ]
\ No newline at end of file
@@ -233,7 +233,7 @@ def process_enhanced_argo_chat(request):
                             if hasattr(viz_obj, 'to_image'):
                                 # Use compressed PNG and smaller size for efficiency
                                 img_bytes = viz_obj.to_image(format='png', width=600, height=400, scale=0.8)
-                                img_base64 = base64.b64encode(img_bytes).decode('utf-8')
+                                img_base64 = base64.b64encode(img_bytes).decode('ascii')
                                 visualizations[viz_type] = {
                                     'data': f"data:image/png;base64,{img_base64}",
                                     'type': viz_type,
@@ -23,9 +23,11 @@ NO OTHER TABLES ARE USED. All chatbot responses are based solely on data from th
 
 import os
 import logging
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import Iterator, List, Dict, Optional, Any
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -35,6 +37,27 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One pooled engine per database URI, shared by every DatabaseManager (RAG
+# pipeline, MCP server, vector store, module helpers) so connections to the
+# remote Neon cluster are reused instead of re-handshaking per manager
+_ENGINES: Dict[str, Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+def _get_engine(database_uri: str) -> Engine:
+    '''Return the shared pooled engine for a database URI, creating it once'''
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(database_uri)
+        if engine is None:
+            engine = create_engine(
+                database_uri,
+                pool_size=5,
+                max_overflow=15,      # up to 20 concurrent connections
+                pool_pre_ping=True,   # Neon drops idle connections
+                pool_recycle=300
+            )
+            _ENGINES[database_uri] = engine
+        return engine
+
 class DatabaseManager:
     '''Database manager for ARGO profiles with vector operations - using raw SQL'''
 
@@ -44,42 +67,46 @@ class DatabaseManager:
         if not self.database_uri:
             raise ValueError("DATABASE_URI or DATABASE_URL not found in environment variables")
 
-        self.engine = create_engine(self.database_uri)
+        self.engine = _get_engine(self.database_uri)
         logger.info("Database connection established")
-    
+
+    # Indian Ocean measurements joined with their source file - dataset_values table ONLY
+    _MEASUREMENTS_QUERY = """
+        SELECT 
+            d.filename,
+            v.lat,
+            v.lon,
+            v.time,
+            v.depth,
+            v.value as temperature,
+            v.variable
+        FROM dataset_values v
+        INNER JOIN datasets d ON v.dataset_id = d.id
+        WHERE v.lat BETWEEN -60 AND 30
+          AND v.lon BETWEEN 20 AND 150
+    """
+
+    @staticmethod
+    def _measurement_from_row(row) -> Dict:
+        '''Convert a _MEASUREMENTS_QUERY row into a measurement dict'''
+        return {
+            'filename': row[0],
+            'latitude': float(row[1]) if row[1] else 0,
+            'longitude': float(row[2]) if row[2] else 0,
+            'time': row[3],
+            'depth': float(row[4]) if row[4] else 0,
+            'temperature': float(row[5]) if row[5] else 0,
+            'variable': row[6],
+            'summary': f"ARGO {row[6]}: {row[5]} at depth {row[4]}m (Indian Ocean only)"
+        }
+
     def get_all_measurements(self) -> List[Dict]:
         '''Get all ARGO measurements from Neon cloud database - dataset_values table ONLY'''
         with self.engine.connect() as connection:
             try:
-                # Query dataset_values table with JOIN to datasets table
                 # NO LIMIT - returns ALL measurements for complete analysis
-                result = connection.execute(text("""
-                    SELECT 
-                        d.filename,
-                        v.lat,
-                        v.lon,
-                        v.time,
-                        v.depth,
-                        v.value as temperature,
-                        v.variable
-                    FROM dataset_values v
-                    INNER JOIN datasets d ON v.dataset_id = d.id
-                    WHERE v.lat BETWEEN -60 AND 30
-                      AND v.lon BETWEEN 20 AND 150
-                """))
-
-                results = []
-                for row in result.fetchall():
-                    results.append({
-                        'filename': row[0],
-                        'latitude': float(row[1]) if row[1] else 0,
-                        'longitude': float(row[2]) if row[2] else 0,
-                        'time': row[3],
-                        'depth': float(row[4]) if row[4] else 0,
-                        'temperature': float(row[5]) if row[5] else 0,
-                        'variable': row[6],
-                        'summary': f"ARGO {row[6]}: {row[5]} at depth {row[4]}m (Indian Ocean only)"
-                    })
+                result = connection.execute(text(self._MEASUREMENTS_QUERY))
+                results = [self._measurement_from_row(row) for row in result.fetchall()]
 
                 logger.info(f"✅ Retrieved {len(results)} measurements from Neon cloud database (dataset_values)")
                 return results
@@ -88,6 +115,14 @@ class DatabaseManager:
                 logger.error(f"❌ Error retrieving measurements from Neon database: {e}")
                 return []
 
+    def iter_measurements(self, batch_size: int = 1000) -> Iterator[Dict]:
+        '''Stream ARGO measurements with a server-side cursor, holding at most batch_size rows in memory'''
+        with self.engine.connect() as connection:
+            result = connection.execution_options(yield_per=batch_size).execute(text(self._MEASUREMENTS_QUERY))
+            for partition in result.partitions():
+                for row in partition:
+                    yield self._measurement_from_row(row)
+
     def _fix_group_by_clause(self, sql_query: str) -> str:
         """Fix SQL query by adding missing columns to GROUP BY clause"""
         import re
@@ -266,11 +301,11 @@ class DatabaseManager:
                 logger.error(f"❌ Error getting Neon database stats: {e}")
                 return {'error': str(e)}
 
-    def execute_sql_query(self, sql_query: str) -> List[Dict]:
-        """Execute SQL query and return results with error handling for GROUP BY"""
+    def execute_sql_query(self, sql_query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        """Execute SQL query (with optional bind parameters) and return results with error handling for GROUP BY"""
         with self.engine.connect() as connection:
             try:
-                result = connection.execute(text(sql_query))
+                result = connection.execute(text(sql_query), params or {})
 
                 # Convert to dict format
                 if result.keys():
@@ -293,7 +328,7 @@ class DatabaseManager:
                         fixed_query = self._fix_group_by_clause(sql_query)
                         if fixed_query != sql_query:
                             logger.info("Retrying with fixed query...")
-                            result = connection.execute(text(fixed_query))
+                            result = connection.execute(text(fixed_query), params or {})
                             if result.keys():
                                 columns = result.keys()
                                 data_dicts = [dict(zip(columns, row)) for row in result.fetchall()]
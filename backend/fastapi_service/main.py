@@ -13,6 +13,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import websockets
 
@@ -693,6 +694,22 @@ async def http_chat_query(message: ChatMessage):
             detail=str(e)
         )
 
+@app.post("/api/chat/stream")
+async def http_chat_stream(message: ChatMessage):
+    """HTTP endpoint streaming the RAG answer as plain-text chunks"""
+    return StreamingResponse(
+        chatbot.rag_pipeline.stream_query(message.message),
+        media_type="text/plain; charset=utf-8"
+    )
+
+@app.post("/api/visualizations/dashboard/stream")
+async def http_dashboard_stream(message: ChatMessage):
+    """HTTP endpoint streaming dashboard panels as NDJSON (one plotly figure per line)"""
+    return StreamingResponse(
+        chatbot.rag_pipeline.stream_dashboard(message.message),
+        media_type="application/x-ndjson"
+    )
+
 @app.get("/api/chat/sessions/{session_id}")
 async def get_chat_session(session_id: str):
     """Get chat session history"""
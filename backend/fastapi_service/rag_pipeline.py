@@ -25,9 +25,15 @@ NO fallback data, NO demo data, NO hardcoded values.
 import os
 import json
 import re
+import time
+import asyncio
+import httpx
+import pandas as pd
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from string import Template
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from .vector_store import VectorStore
 from .database import DatabaseManager
 from .enhanced_argo_processor import EnhancedArgoProcessor
@@ -37,6 +43,126 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Pre-built SQL for _generate_sql_query, keyed by (query_kind, data_type).
+# Geographic bounds are always bound as :lat_min/:lat_max/:lon_min/:lon_max.
+_SQL_AGGREGATE_TEMPLATE = """
+SELECT
+    ROUND(AVG(value)::numeric, 3) as avg_{var},
+    COUNT(*) as total_measurements,
+    ROUND(MIN(value)::numeric, 3) as min_{var},
+    ROUND(MAX(value)::numeric, 3) as max_{var},
+    ROUND(STDDEV(value)::numeric, 3) as std_{var}
+FROM dataset_values
+WHERE variable = '{var}'
+  AND value IS NOT NULL
+  AND lat BETWEEN :lat_min AND :lat_max
+  AND lon BETWEEN :lon_min AND :lon_max
+"""
+
+_SQL_PROFILE_TEMPLATE = """
+WITH sampled_locations AS (
+    SELECT DISTINCT lat, lon
+    FROM dataset_values
+    WHERE variable = '{var}'
+      AND lat BETWEEN :lat_min AND :lat_max
+      AND lon BETWEEN :lon_min AND :lon_max
+    ORDER BY RANDOM()
+    LIMIT 5
+)
+SELECT v.lat as latitude, v.lon as longitude, v.depth, v.value as {var}
+FROM dataset_values v
+INNER JOIN sampled_locations s ON v.lat = s.lat AND v.lon = s.lon
+WHERE v.variable = '{var}'
+  AND v.value IS NOT NULL
+ORDER BY v.lat, v.lon, v.depth NULLS FIRST
+LIMIT 500
+"""
+
+_SQL_SAMPLE_TEMPLATE = """
+SELECT lat as latitude, lon as longitude, depth, value as {var}
+FROM dataset_values
+WHERE variable = '{var}'
+  AND value IS NOT NULL
+  AND lat BETWEEN :lat_min AND :lat_max
+  AND lon BETWEEN :lon_min AND :lon_max
+ORDER BY depth NULLS FIRST
+LIMIT 1000
+"""
+
+_SQL_TEMPLATES = {}
+for _var in ('temperature', 'salinity'):
+    _SQL_TEMPLATES[('aggregate', _var)] = _SQL_AGGREGATE_TEMPLATE.format(var=_var).strip()
+    _SQL_TEMPLATES[('profile', _var)] = _SQL_PROFILE_TEMPLATE.format(var=_var).strip()
+    _SQL_TEMPLATES[('sample', _var)] = _SQL_SAMPLE_TEMPLATE.format(var=_var).strip()
+
+_SQL_TEMPLATES[('aggregate', None)] = """
+SELECT 
+    COUNT(*) as total_measurements,
+    COUNT(DISTINCT CASE WHEN variable = 'temperature' THEN 1 END) as temp_count,
+    COUNT(DISTINCT CASE WHEN variable = 'salinity' THEN 1 END) as sal_count,
+    ROUND(AVG(CASE WHEN variable = 'temperature' THEN value END)::numeric, 3) as avg_temp,
+    ROUND(AVG(CASE WHEN variable = 'salinity' THEN value END)::numeric, 3) as avg_sal
+FROM dataset_values
+WHERE lat BETWEEN :lat_min AND :lat_max
+  AND lon BETWEEN :lon_min AND :lon_max
+""".strip()
+
+_SQL_TEMPLATES[('sample', None)] = """
+SELECT 
+    v.lat as latitude, 
+    v.lon as longitude, 
+    v.depth,
+    MAX(CASE WHEN v.variable = 'temperature' THEN v.value END) as temperature,
+    MAX(CASE WHEN v.variable = 'salinity' THEN v.value END) as salinity
+FROM dataset_values v
+WHERE v.lat BETWEEN :lat_min AND :lat_max
+  AND v.lon BETWEEN :lon_min AND :lon_max
+GROUP BY v.lat, v.lon, v.depth
+ORDER BY depth NULLS FIRST
+LIMIT 500
+""".strip()
+
+# Answer prompt for _build_answer_prompt. The instructions are an invariant
+# prefix so repeated queries share the same prompt start.
+_ANSWER_PROMPT = Template("""
+You are an expert Oceanographic Assistant for INDIAN OCEAN data from our dataset ONLY.
+
+STRICT RULES:
+1. ONLY use data from the dataset context and query results provided
+2. ALWAYS mention "dataset" as your data source
+3. ONLY discuss Indian Ocean regions: Arabian Sea, Bay of Bengal, Southern Indian Ocean
+4. If no relevant data in context, say "No relevant Indian Ocean data found in our dataset."
+5. ALL numeric values must come from the actual database results provided
+6. Never use external oceanographic knowledge or general facts
+7. Emphasize that data is verified and stored securely in our dataset
+8. When showing profiles, mention the locations sampled and depth ranges
+
+Provide a detailed answer mentioning:
+- Data source (our secure dataset)
+- Number of measurements analyzed
+- Key findings from the data
+- Geographic context (Indian Ocean region)
+
+USER QUERY: "$user_query"
+
+DATASET CONTEXT: Found $n_context relevant ARGO profiles in dataset.
+
+QUERY RESULTS: $data_summary
+Data Details: $data_details
+""")
+
+_SQL_FALLBACK_TEMPLATE = """
+SELECT 
+    lat as latitude, 
+    lon as longitude, 
+    MAX(CASE WHEN variable = 'temperature' THEN value END) as temperature,
+    MAX(CASE WHEN variable = 'salinity' THEN value END) as salinity
+FROM dataset_values
+WHERE value IS NOT NULL
+GROUP BY lat, lon
+ORDER BY lat, lon
+""".strip()
+
 class RAGPipeline:
     """FAST Response RAG Pipeline - Optimized for speed with intelligent caching"""
 
@@ -187,8 +313,9 @@ In our database: 1,196 measurements from ARGO floats in the Indian Ocean region.
 
     # REMOVED: No Ollama fallback generation - Groq + Neon database only
 
-    def _groq_generate(self, prompt: str, temperature: float = 0.1, max_tokens: int = 500) -> str:
-        """Generate text using Groq API ONLY - NO fallbacks allowed"""
+    def _groq_request(self, prompt: str, temperature: float, max_tokens: int,
+                      stream: bool = False) -> Tuple[str, Dict, Dict]:
+        """Build the Groq chat completion request (url, headers, payload)"""
         groq_api_key = os.getenv("GROQ_API_KEY") or os.getenv("GROQ_API")
         
         if not groq_api_key:
@@ -219,9 +346,14 @@ In our database: 1,196 measurements from ARGO floats in the Indian Ocean region.
             ],
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "stream": False,
+            "stream": stream,
             "top_p": 0.9
         }
+        return url, headers, payload
+
+    def _groq_generate(self, prompt: str, temperature: float = 0.1, max_tokens: int = 500) -> str:
+        """Generate text using Groq API ONLY - NO fallbacks allowed"""
+        url, headers, payload = self._groq_request(prompt, temperature, max_tokens)
 
         try:
             response = requests.post(url, json=payload, headers=headers, timeout=60)
@@ -250,6 +382,26 @@ In our database: 1,196 measurements from ARGO floats in the Indian Ocean region.
             logger.error(f"❌ Groq API failed: {e}")
             raise Exception(f"Groq API error - no backup available: {e}")
 
+    async def _groq_generate_stream(self, prompt: str, temperature: float = 0.1,
+                                    max_tokens: int = 500) -> AsyncIterator[str]:
+        """Stream generated text from the Groq API token by token"""
+        url, headers, payload = self._groq_request(prompt, temperature, max_tokens, stream=True)
+
+        async with httpx.AsyncClient(timeout=60) as client:
+            async with client.stream("POST", url, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                # OpenAI-compatible server-sent events: "data: {...}" ... "data: [DONE]"
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = json.loads(data).get("choices") or [{}]
+                    token = choices[0].get("delta", {}).get("content")
+                    if token:
+                        yield token
+
     # REMOVED: No fallback responses - Groq + Neon database only
     def _removed_fallback_method(self, prompt: str) -> str:
         """Generate basic fallback responses when Ollama is unavailable"""
@@ -386,23 +538,21 @@ Data Quality:
             # Step 1: Extract intent
             query_analysis = self._analyze_query(user_query)
 
-            # Step 2: Retrieve context
-            context = self._retrieve_context(user_query, filters, query_analysis)
-
-            # Step 3: Generate SQL query if needed
+            # Step 2: Generate SQL query if needed
             sql_query = None
             if query_analysis.get('needs_sql', False):
-                sql_query = self._generate_sql_query(user_query, query_analysis, context)
+                sql_query = self._generate_sql_query(user_query, query_analysis, [])
 
-            # Step 4: Execute query and get data
-            data_results = self._execute_data_query(sql_query, context)
+            # Step 3 + 4: Retrieve context and execute the data query concurrently
+            context, data_results = self._fetch_context_and_data(user_query, filters, query_analysis, sql_query)
 
             # Step 5: Generate final answer
             answer = self._generate_answer(user_query, context, data_results, query_analysis)
 
             return {
                 'answer': answer,
-                'sql_query': sql_query,
+                'sql_query': sql_query[0] if sql_query else None,
+                'sql_params': sql_query[1] if sql_query else None,
                 'data': data_results,
                 'context': context,
                 'query_analysis': query_analysis
@@ -415,6 +565,69 @@ Data Quality:
                 'error': str(e)
             }
 
+    def _fetch_context_and_data(self, user_query: str, filters: Optional[Dict], analysis: Dict,
+                                sql_query: Optional[Tuple[str, Dict]]) -> Tuple[List[Dict], Any]:
+        """Run context retrieval and the data query in parallel (they are independent)"""
+        if not sql_query:
+            context = self._retrieve_context(user_query, filters, analysis)
+            return context, context
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            context_future = executor.submit(self._retrieve_context, user_query, filters, analysis)
+            data_future = executor.submit(self._execute_data_query, sql_query, None)
+            context = context_future.result()
+            data_results = data_future.result()
+
+        # _execute_data_query falls back to the context it was given on error
+        if data_results is None:
+            data_results = context
+        return context, data_results
+
+    async def stream_query(self, user_query: str, filters: Optional[Dict] = None) -> AsyncIterator[str]:
+        """Process query like process_query, but stream the answer as it is generated"""
+        # fast_query reads database stats on a cache miss - keep it off the event loop
+        fast_response = await asyncio.to_thread(self.fast_query, user_query)
+        if fast_response is not None:
+            yield fast_response
+            return
+
+        try:
+            query_analysis = await asyncio.to_thread(self._analyze_query, user_query)
+
+            sql_query = None
+            if query_analysis.get('needs_sql', False):
+                sql_query = self._generate_sql_query(user_query, query_analysis, [])
+
+            context, data_results = await asyncio.to_thread(
+                self._fetch_context_and_data, user_query, filters, query_analysis, sql_query
+            )
+
+            answer_prompt = self._build_answer_prompt(user_query, context, data_results)
+            async for token in self._groq_generate_stream(answer_prompt, temperature=0.3, max_tokens=1500):
+                yield token
+
+        except Exception as e:
+            logger.error(f"Error in streaming RAG pipeline: {e}")
+            yield f"I apologize, but I encountered an error processing your query: {str(e)}"
+
+    async def stream_dashboard(self, user_query: str, filters: Optional[Dict] = None) -> AsyncIterator[str]:
+        """Stream the comprehensive dashboard for a query as NDJSON, one panel per line"""
+        try:
+            # Keyword analysis is enough to pick the region - no LLM round trip
+            analysis = self._basic_query_analysis(user_query)
+            context = await asyncio.to_thread(self._retrieve_context, user_query, filters, analysis)
+
+            panels = self.visualizer.iter_dashboard_panels(context)
+            while True:
+                line = await asyncio.to_thread(next, panels, None)
+                if line is None:
+                    break
+                yield line
+
+        except Exception as e:
+            logger.error(f"Error streaming dashboard: {e}")
+            yield json.dumps({'error': str(e)}) + "\n"
+
     def _analyze_query(self, query: str) -> Dict:
         """Analyze user query to extract intent and parameters"""
         analysis_prompt = f"""
@@ -533,8 +746,8 @@ Data Quality:
             logger.error(f"Error retrieving context: {e}")
             return []
 
-    def _generate_sql_query(self, user_query: str, analysis: Dict, context: List[Dict]) -> str:
-        """Generate SQL query for data retrieval with robust error handling"""
+    def _generate_sql_query(self, user_query: str, analysis: Dict, context: List[Dict]) -> Tuple[str, Dict]:
+        """Select a pre-built SQL template and bind parameters for data retrieval"""
         try:
             # DIRECT FALLBACK: Use simple, safe queries instead of LLM-generated ones
             # This prevents agg/paging errors and ensures reliable operation
@@ -547,204 +760,70 @@ Data Quality:
             is_profile_query = any(word in user_query_lower for word in ['profile', 'show', 'display', 'view', 'list'])
             is_aggregate_query = any(word in user_query_lower for word in ['average', 'avg', 'mean', 'total', 'count', 'sum', 'statistics', 'stats'])
 
-            # For temperature-related queries
             if 'temperature' in user_query_lower or 'temp' in user_query_lower:
-                if is_aggregate_query:
-                    # Aggregate query - statistical summary
-                    sql_query = """
-                    SELECT
-                        ROUND(AVG(value)::numeric, 3) as avg_temperature,
-                        COUNT(*) as total_measurements,
-                        ROUND(MIN(value)::numeric, 3) as min_temperature,
-                        ROUND(MAX(value)::numeric, 3) as max_temperature,
-                        ROUND(STDDEV(value)::numeric, 3) as std_temperature
-                    FROM dataset_values
-                    WHERE variable = 'temperature'
-                      AND value IS NOT NULL
-                      AND lat BETWEEN {} AND {}
-                      AND lon BETWEEN {} AND {}
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-                elif is_profile_query:
-                    # Profile query - sample representative data points
-                    sql_query = """
-                    WITH sampled_locations AS (
-                        SELECT DISTINCT lat, lon
-                        FROM dataset_values
-                        WHERE variable = 'temperature'
-                          AND lat BETWEEN {} AND {}
-                          AND lon BETWEEN {} AND {}
-                        ORDER BY RANDOM()
-                        LIMIT 5
-                    )
-                    SELECT v.lat as latitude, v.lon as longitude, v.depth, v.value as temperature
-                    FROM dataset_values v
-                    INNER JOIN sampled_locations s ON v.lat = s.lat AND v.lon = s.lon
-                    WHERE v.variable = 'temperature'
-                      AND v.value IS NOT NULL
-                    ORDER BY v.lat, v.lon, v.depth NULLS FIRST
-                    LIMIT 500
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-                else:
-                    # General query - top results by depth
-                    sql_query = """
-                    SELECT lat as latitude, lon as longitude, depth, value as temperature
-                    FROM dataset_values
-                    WHERE variable = 'temperature'
-                      AND value IS NOT NULL
-                      AND lat BETWEEN {} AND {}
-                      AND lon BETWEEN {} AND {}
-                    ORDER BY depth NULLS FIRST
-                    LIMIT 1000
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-
-            # For salinity-related queries
+                data_type = 'temperature'
             elif 'salinity' in user_query_lower or 'salt' in user_query_lower:
-                if is_aggregate_query:
-                    sql_query = """
-                    SELECT
-                        ROUND(AVG(value)::numeric, 3) as avg_salinity,
-                        COUNT(*) as total_measurements,
-                        ROUND(MIN(value)::numeric, 3) as min_salinity,
-                        ROUND(MAX(value)::numeric, 3) as max_salinity,
-                        ROUND(STDDEV(value)::numeric, 3) as std_salinity
-                    FROM dataset_values
-                    WHERE variable = 'salinity'
-                      AND value IS NOT NULL
-                      AND lat BETWEEN {} AND {}
-                      AND lon BETWEEN {} AND {}
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-                elif is_profile_query:
-                    # Profile query - sample representative data points
-                    sql_query = """
-                    WITH sampled_locations AS (
-                        SELECT DISTINCT lat, lon
-                        FROM dataset_values
-                        WHERE variable = 'salinity'
-                          AND lat BETWEEN {} AND {}
-                          AND lon BETWEEN {} AND {}
-                        ORDER BY RANDOM()
-                        LIMIT 5
-                    )
-                    SELECT v.lat as latitude, v.lon as longitude, v.depth, v.value as salinity
-                    FROM dataset_values v
-                    INNER JOIN sampled_locations s ON v.lat = s.lat AND v.lon = s.lon
-                    WHERE v.variable = 'salinity'
-                      AND v.value IS NOT NULL
-                    ORDER BY v.lat, v.lon, v.depth NULLS FIRST
-                    LIMIT 500
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-                else:
-                    sql_query = """
-                    SELECT lat as latitude, lon as longitude, depth, value as salinity
-                    FROM dataset_values
-                    WHERE variable = 'salinity'
-                      AND value IS NOT NULL
-                      AND lat BETWEEN {} AND {}
-                      AND lon BETWEEN {} AND {}
-                    ORDER BY depth NULLS FIRST
-                    LIMIT 1000
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-
-            # Default query for general data requests
+                data_type = 'salinity'
             else:
-                if is_aggregate_query:
-                    sql_query = """
-                    SELECT 
-                        COUNT(*) as total_measurements,
-                        COUNT(DISTINCT CASE WHEN variable = 'temperature' THEN 1 END) as temp_count,
-                        COUNT(DISTINCT CASE WHEN variable = 'salinity' THEN 1 END) as sal_count,
-                        ROUND(AVG(CASE WHEN variable = 'temperature' THEN value END)::numeric, 3) as avg_temp,
-                        ROUND(AVG(CASE WHEN variable = 'salinity' THEN value END)::numeric, 3) as avg_sal
-                    FROM dataset_values
-                    WHERE lat BETWEEN {} AND {}
-                      AND lon BETWEEN {} AND {}
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-                else:
-                    sql_query = """
-                    SELECT 
-                        v.lat as latitude, 
-                        v.lon as longitude, 
-                        v.depth,
-                        MAX(CASE WHEN v.variable = 'temperature' THEN v.value END) as temperature,
-                        MAX(CASE WHEN v.variable = 'salinity' THEN v.value END) as salinity
-                    FROM dataset_values v
-                    WHERE v.lat BETWEEN {} AND {}
-                      AND v.lon BETWEEN {} AND {}
-                    GROUP BY v.lat, v.lon, v.depth
-                    ORDER BY depth NULLS FIRST
-                    LIMIT 500
-                    """.format(lat_range[0], lat_range[1], lon_range[0], lon_range[1])
-
-            logger.info(f"Generated SQL query: {sql_query.strip()}")
-            return sql_query.strip()
+                data_type = None
+
+            if is_aggregate_query:
+                query_kind = 'aggregate'
+            elif is_profile_query and data_type:
+                query_kind = 'profile'
+            else:
+                query_kind = 'sample'
+
+            sql_query = _SQL_TEMPLATES[(query_kind, data_type)]
+            params = {
+                'lat_min': lat_range[0], 'lat_max': lat_range[1],
+                'lon_min': lon_range[0], 'lon_max': lon_range[1]
+            }
+
+            logger.info(f"Generated SQL query ({query_kind}, {data_type}) with params {params}")
+            return sql_query, params
 
         except Exception as e:
             logger.error(f"Error generating SQL query: {e}")
             # Ultimate fallback - NO LIMIT for comprehensive error recovery
-            return """
-            SELECT 
-                lat as latitude, 
-                lon as longitude, 
-                MAX(CASE WHEN variable = 'temperature' THEN value END) as temperature,
-                MAX(CASE WHEN variable = 'salinity' THEN value END) as salinity
-            FROM dataset_values
-            WHERE value IS NOT NULL
-            GROUP BY lat, lon
-            ORDER BY lat, lon
-            """.strip()
-
-    def _execute_data_query(self, sql_query: Optional[str], context: List[Dict]) -> Optional[Any]:
+            return _SQL_FALLBACK_TEMPLATE, {}
+
+    def _execute_data_query(self, sql_query: Optional[Tuple[str, Dict]], context: List[Dict]) -> Optional[Any]:
         """Execute data query and return results"""
         try:
             if sql_query:
-                return self.db_manager.execute_sql_query(sql_query)
+                template, params = sql_query
+                return self.db_manager.execute_sql_query(template, params)
             else:
                 return context
         except Exception as e:
             logger.error(f"Error executing data query: {e}")
             return context
 
+    def _build_answer_prompt(self, user_query: str, context: List[Dict], data_results: Any) -> str:
+        """Build the LLM prompt for the final answer from retrieved context and data"""
+        # Format data results for better presentation
+        data_summary = ""
+        if data_results:
+            if isinstance(data_results, list) and len(data_results) > 0:
+                data_summary = f"Retrieved {len(data_results)} data points from dataset"
+                # Show sample if large dataset
+                if len(data_results) > 100:
+                    data_summary += f" (showing analysis of {len(data_results)} measurements)"
+            elif isinstance(data_results, dict):
+                data_summary = f"Statistical summary from dataset: {data_results}"
+        
+        return _ANSWER_PROMPT.substitute(
+            user_query=user_query,
+            n_context=len(context),
+            data_summary=data_summary,
+            data_details=str(data_results)[:2000] if data_results else "No data results"
+        )
+
     def _generate_answer(self, user_query: str, context: List[Dict], data_results: Any, analysis: Dict) -> str:
         """Generate final answer using retrieved context and data"""
         try:
-            # Format data results for better presentation
-            data_summary = ""
-            if data_results:
-                if isinstance(data_results, list) and len(data_results) > 0:
-                    data_summary = f"Retrieved {len(data_results)} data points from dataset"
-                    # Show sample if large dataset
-                    if len(data_results) > 100:
-                        data_summary += f" (showing analysis of {len(data_results)} measurements)"
-                elif isinstance(data_results, dict):
-                    data_summary = f"Statistical summary from dataset: {data_results}"
-            
-            answer_prompt = f"""
-            You are an expert Oceanographic Assistant for INDIAN OCEAN data from our dataset ONLY.
-
-            STRICT RULES:
-            1. ONLY use data from the dataset context and query results provided
-            2. ALWAYS mention "dataset" as your data source
-            3. ONLY discuss Indian Ocean regions: Arabian Sea, Bay of Bengal, Southern Indian Ocean
-            4. If no relevant data in context, say "No relevant Indian Ocean data found in our dataset."
-            5. ALL numeric values must come from the actual database results provided
-            6. Never use external oceanographic knowledge or general facts
-            7. Emphasize that data is verified and stored securely in our dataset
-            8. When showing profiles, mention the locations sampled and depth ranges
-
-            USER QUERY: "{user_query}"
-
-            DATASET CONTEXT: Found {len(context)} relevant ARGO profiles in dataset.
-            
-            QUERY RESULTS: {data_summary}
-            Data Details: {str(data_results)[:2000] if data_results else "No data results"}
-
-            Provide a detailed answer mentioning:
-            - Data source (our secure dataset)
-            - Number of measurements analyzed
-            - Key findings from the data
-            - Geographic context (Indian Ocean region)
-            """
-
+            answer_prompt = self._build_answer_prompt(user_query, context, data_results)
             return self._groq_generate(answer_prompt, temperature=0.3, max_tokens=1500)
         except Exception as e:
             logger.error(f"Error generating answer: {e}")
@@ -773,25 +852,32 @@ Data Quality:
         """Generate visualizations based on context and analysis"""
         visualizations = {}
         try:
+            tasks = []
             if 'temperature' in analysis.get('data_types', []):
-                temp_plot = self.visualizer.create_temperature_profile_plot(context)
-                if temp_plot:
-                    visualizations['temperature_profile'] = temp_plot
-
+                tasks.append(('temperature_profile', self.visualizer.create_temperature_profile_plot))
             if 'salinity' in analysis.get('data_types', []):
-                sal_plot = self.visualizer.create_salinity_profile_plot(context)
-                if sal_plot:
-                    visualizations['salinity_profile'] = sal_plot
-
+                tasks.append(('salinity_profile', self.visualizer.create_salinity_profile_plot))
             if analysis.get('query_type') == 'search':
-                map_plot = self.visualizer.create_map_view(context)
-                if map_plot:
-                    visualizations['geographic_map'] = map_plot
-
-            if len(visualizations) >= 2:
-                dashboard = self.visualizer.create_comprehensive_dashboard(context)
-                if dashboard:
-                    visualizations['dashboard'] = dashboard
+                tasks.append(('geographic_map', self.visualizer.create_map_view))
+            if not tasks:
+                return visualizations
+
+            # Plots are independent and share the same context - render them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {key: executor.submit(fn, context) for key, fn in tasks}
+                dashboard_future = None
+                if len(tasks) >= 2:
+                    dashboard_future = executor.submit(self.visualizer.create_comprehensive_dashboard, context)
+
+                for key, _ in tasks:
+                    plot = futures[key].result()
+                    if plot:
+                        visualizations[key] = plot
+
+                if dashboard_future is not None:
+                    dashboard = dashboard_future.result()
+                    if dashboard and len(visualizations) >= 2:
+                        visualizations['dashboard'] = dashboard
         except Exception as e:
             logger.error(f"Error generating visualizations: {e}")
         return visualizations
@@ -840,21 +926,22 @@ Data Quality:
         if not profiles:
             return {}
 
-        latitudes = [p.get('latitude') for p in profiles if p.get('latitude') is not None]
-        longitudes = [p.get('longitude') for p in profiles if p.get('longitude') is not None]
+        df = pd.DataFrame(profiles)
+        latitudes = df['latitude'].dropna() if 'latitude' in df else pd.Series(dtype=float)
+        longitudes = df['longitude'].dropna() if 'longitude' in df else pd.Series(dtype=float)
 
         stats = {'total_profiles': len(profiles)}
-        if latitudes:
+        if not latitudes.empty:
             stats['geographic_coverage'] = {
-                'lat_range': [min(latitudes), max(latitudes)],
-                'lon_range': [min(longitudes), max(longitudes)]
+                'lat_range': [float(latitudes.min()), float(latitudes.max())],
+                'lon_range': [float(longitudes.min()), float(longitudes.max())] if not longitudes.empty else []
             }
         return stats
 
     def get_system_status(self) -> Dict:
         """Get system status and capabilities"""
         try:
-            db_stats = self.db_manager.get_database_stats()
+            db_stats = self.get_cached_database_stats()
             return {
                 'system_status': 'operational',
                 'database': 'connected' if db_stats else 'disconnected',
@@ -864,8 +951,25 @@ Data Quality:
         except Exception as e:
             return {'system_status': 'error', 'error': str(e)}
 
-def test_groq_connection():
-    """Test Groq API connection and return status"""
+# Process-wide cache for the Groq connectivity probe (result, timestamp)
+_GROQ_TEST_CACHE = None
+_GROQ_TEST_TS = 0.0
+_GROQ_TEST_TTL = 300  # 5 minutes cache
+
+def test_groq_connection(force: bool = False):
+    """Test Groq API connection and return status (cached for _GROQ_TEST_TTL seconds)"""
+    global _GROQ_TEST_CACHE, _GROQ_TEST_TS
+
+    now = time.time()
+    if not force and _GROQ_TEST_CACHE is not None and (now - _GROQ_TEST_TS) < _GROQ_TEST_TTL:
+        return _GROQ_TEST_CACHE
+
+    _GROQ_TEST_CACHE = _probe_groq_connection()
+    _GROQ_TEST_TS = now
+    return _GROQ_TEST_CACHE
+
+def _probe_groq_connection():
+    """Send a minimal request to the Groq API and return status"""
     try:
         groq_api_key = os.getenv("GROQ_API_KEY") or os.getenv("GROQ_API")
         if not groq_api_key:
@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from fastapi_service.vector_store import VectorStore
+
+
+class SimilaritySearchFilterTests(unittest.TestCase):
+    """Post-filtering in VectorStore.similarity_search"""
+
+    def setUp(self):
+        # Skip __init__ - it opens a database connection
+        self.store = VectorStore.__new__(VectorStore)
+        self.store.filter_overscan = 8
+        self.store.generate_embedding = mock.Mock(return_value=[0.1, 0.2, 0.3])
+        self.store.db_manager = mock.Mock()
+
+        self.rows = [
+            {'id': 1, 'latitude': 10.0, 'longitude': 60.0, 'temperature': None,
+             'time': datetime(2023, 1, 5)},
+            {'id': 2, 'latitude': 80.0, 'longitude': 60.0, 'temperature': 25.1,
+             'time': datetime(2023, 1, 6)},
+            {'id': 3, 'latitude': 12.0, 'longitude': 61.0, 'temperature': 26.4,
+             'time': None},
+            {'id': 4, 'latitude': 11.0, 'longitude': 62.0, 'temperature': 27.0,
+             'time': datetime(2024, 6, 1)},
+        ]
+        self.store.db_manager.search_similar_measurements.return_value = self.rows
+
+    def test_filtered_rows_are_returned_unchanged(self):
+        results = self.store.similarity_search('warm water', limit=10, filters={
+            'lat_range': [-60, 30],
+            'time_range': [datetime(2023, 1, 1), datetime(2023, 12, 31)],
+        })
+
+        self.assertEqual([r['id'] for r in results], [1, 3])
+        # The caller's dicts come back as-is: None stays None (not NaN/NaT)
+        self.assertIs(results[0], self.rows[0])
+        self.assertIsNone(results[0]['temperature'])
+        self.assertIsNone(results[1]['time'])
+        self.assertIsInstance(results[0]['time'], datetime)
+
+    def test_limit_applies_after_filtering(self):
+        results = self.store.similarity_search('warm water', limit=1, filters={
+            'lat_range': [-60, 30],
+        })
+
+        self.assertEqual([r['id'] for r in results], [1])
+        self.store.db_manager.search_similar_measurements.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+
+from fastapi_service import visualizations
+from fastapi_service.visualizations import ArgoVisualizer
+
+
+class RenderCacheTests(unittest.TestCase):
+    """Render cache used by the public ArgoVisualizer.create_* methods"""
+
+    def setUp(self):
+        visualizations._render_cache_clear()
+        self.addCleanup(visualizations._render_cache_clear)
+        self.visualizer = ArgoVisualizer()
+        self.profiles = [
+            {'float_id': '2902746', 'cycle_number': 12, 'profile_date': datetime(2023, 3, 1),
+             'pressure': np.arange(500.0), 'temperature': np.linspace(28.0, 4.0, 500)},
+            {'float_id': '2902747', 'cycle_number': 3, 'profile_date': datetime(2023, 3, 2),
+             'pressure': np.arange(500.0), 'temperature': np.linspace(27.0, 5.0, 500)},
+        ]
+
+    def test_same_profiles_are_served_from_cache(self):
+        render = mock.Mock(return_value='<div>plot</div>')
+
+        first = self.visualizer._cached_render('temperature', self.profiles, 'plotly', render)
+        second = self.visualizer._cached_render('temperature', self.profiles, 'plotly', render)
+
+        self.assertEqual(first, second)
+        render.assert_called_once()
+
+    def test_different_profiles_miss(self):
+        render = mock.Mock(return_value='<div>plot</div>')
+        other = [dict(self.profiles[0], cycle_number=13)]
+
+        self.visualizer._cached_render('temperature', self.profiles, 'plotly', render)
+        self.visualizer._cached_render('temperature', other, 'plotly', render)
+        self.visualizer._cached_render('salinity', self.profiles, 'plotly', render)
+
+        self.assertEqual(render.call_count, 3)
+
+    def test_profiles_without_identity_are_not_cached(self):
+        render = mock.Mock(return_value='<div>plot</div>')
+        anonymous = [{'temperature': [20.0, 19.5]}]
+
+        self.visualizer._cached_render('temperature', anonymous, 'plotly', render)
+        self.visualizer._cached_render('temperature', anonymous, 'plotly', render)
+
+        self.assertEqual(render.call_count, 2)
+
+    def test_array_in_identity_field_fails_loudly(self):
+        profiles = [{'float_id': np.arange(3)}]
+
+        with self.assertRaises(TypeError):
+            self.visualizer._render_cache_key('temperature', profiles, 'plotly')
+
+    def test_cache_is_bounded_by_bytes(self):
+        with mock.patch.object(visualizations, '_RENDER_CACHE_MAXBYTES', 10):
+            render = mock.Mock(return_value='x' * 6)
+            self.visualizer._cached_render('temperature', self.profiles[:1], 'plotly', render)
+            self.visualizer._cached_render('temperature', self.profiles[1:], 'plotly', render)
+
+            # The second entry pushes the total over the limit and evicts the first
+            self.assertEqual(len(visualizations._RENDER_CACHE), 1)
+            self.assertEqual(visualizations._RENDER_CACHE_BYTES, 6)
+
+            # Entries larger than the whole budget are never stored
+            render.return_value = 'x' * 11
+            self.visualizer._cached_render('salinity', self.profiles, 'plotly', render)
+            self.assertEqual(visualizations._RENDER_CACHE_BYTES, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
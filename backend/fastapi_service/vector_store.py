@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from typing import List, Dict, Optional, Tuple
 import requests
 import json
@@ -15,6 +16,7 @@ class VectorStore:
         self.ollama_model = ollama_model
         self.ollama_url = ollama_url
         self.embedding_dim = 768  # Dimension for embeddinggemma (may vary)
+        self.filter_overscan = 8  # Candidate multiplier when post-filtering search results
         
     def generate_embedding(self, text: str) -> List[float]:
         """Generate vector embedding for text using Ollama"""
@@ -82,29 +84,28 @@ class VectorStore:
             # Generate query embedding
             query_embedding = self.generate_embedding(query)
 
-            # Perform vector search using the new method
-            results = self.db_manager.search_similar_measurements(query_embedding, limit)
-
-            # Apply additional filters if provided
-            if filters:
-                filtered_results = []
-                for result in results:
-                    include = True
-                    if 'lat_range' in filters:
-                        lat_min, lat_max = filters['lat_range']
-                        if not (lat_min <= result['latitude'] <= lat_max):
-                            include = False
-                    if 'lon_range' in filters:
-                        lon_min, lon_max = filters['lon_range']
-                        if not (lon_min <= result['longitude'] <= lon_max):
-                            include = False
-                    if 'time_range' in filters and result.get('time'):
-                        start_time, end_time = filters['time_range']
-                        if not (start_time <= result['time'] <= end_time):
-                            include = False
-                    if include:
-                        filtered_results.append(result)
-                results = filtered_results[:limit]
+            # Perform vector search using the new method. When filtering in Python,
+            # over-fetch candidates so the filtered result can still fill `limit`.
+            fetch_limit = limit * self.filter_overscan if filters else limit
+            results = self.db_manager.search_similar_measurements(query_embedding, fetch_limit)
+
+            # Apply additional filters if provided - the mask is vectorized over a
+            # columnar view, but the original row dicts are returned untouched
+            # (a DataFrame round trip would turn None into NaN/NaT)
+            if filters and results:
+                df = pd.DataFrame(results)
+                mask = pd.Series(True, index=df.index)
+                if 'lat_range' in filters:
+                    lat_min, lat_max = filters['lat_range']
+                    mask &= df['latitude'].between(lat_min, lat_max)
+                if 'lon_range' in filters:
+                    lon_min, lon_max = filters['lon_range']
+                    mask &= df['longitude'].between(lon_min, lon_max)
+                if 'time_range' in filters and 'time' in df:
+                    start_time, end_time = filters['time_range']
+                    # Rows without a timestamp are kept, as before
+                    mask &= df['time'].isna() | df['time'].between(start_time, end_time)
+                results = [results[i] for i in np.flatnonzero(mask.to_numpy())[:limit]]
 
             return results
 
@@ -149,12 +150,12 @@ class VectorStore:
     def create_embeddings_for_all_measurements(self) -> bool:
         """Create embeddings for all measurements in the database"""
         try:
-            # This would be used to generate embeddings for the entire cloud dataset
-            measurements = self.db_manager.get_all_measurements()
-            logger.info(f"Creating embeddings for {len(measurements)} measurements")
+            # This would be used to generate embeddings for the entire cloud dataset.
+            # Stream rows from the database so only one batch is resident at a time.
+            logger.info("Creating embeddings for all measurements")
 
             success_count = 0
-            for measurement in measurements:
+            for measurement in self.db_manager.iter_measurements(batch_size=1000):
                 try:
                     embedding = self.generate_embedding(measurement['summary'])
                     # Store the embedding
@@ -3,27 +3,170 @@ Visualization generation for ARGO data using Matplotlib and Plotly.
 Creates interactive plots and charts for oceanographic data analysis.
 """
 
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Server-side rendering only - no GUI backend
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import matplotlib.dates as mdates
 from matplotlib.colors import LinearSegmentedColormap
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import io
+import json
 import base64
+import hashlib
+import itertools
+import threading
 from pathlib import Path
 
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    ds = None
+    tf = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Rendered plots keyed by profile identity - identical inputs (e.g. a
+# dashboard re-render) are served without rebuilding the figure. Bounded by
+# payload size rather than entry count since one figure can be several MB
+_RENDER_CACHE_MAXBYTES = 32 * 1024 * 1024
+_RENDER_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RENDER_CACHE_BYTES = 0
+_RENDER_CACHE_LOCK = threading.Lock()
+
+# Scalar fields that identify a profile (or RAG measurement row) - the cache
+# key is built from these alone so the measurement arrays are never serialized
+_PROFILE_ID_FIELDS = ('id', 'float_id', 'cycle_number', 'profile_date',
+                      'slice_id', 'latitude', 'longitude', 'depth')
+
+def _cache_key_default(value: Any) -> Any:
+    """json.dumps fallback for cache keys - anything that is not a plain scalar is an error"""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, np.generic) and np.ndim(value) == 0:
+        return value.item()
+    raise TypeError(f"Unsupported render cache key value of type {type(value).__name__}")
+
+def _render_cache_get(key: str) -> Optional[str]:
+    with _RENDER_CACHE_LOCK:
+        result = _RENDER_CACHE.get(key)
+        if result is not None:
+            _RENDER_CACHE.move_to_end(key)
+        return result
+
+def _render_cache_put(key: str, result: str) -> None:
+    global _RENDER_CACHE_BYTES
+    size = len(result)
+    if size > _RENDER_CACHE_MAXBYTES:
+        return
+    with _RENDER_CACHE_LOCK:
+        previous = _RENDER_CACHE.pop(key, None)
+        if previous is not None:
+            _RENDER_CACHE_BYTES -= len(previous)
+        _RENDER_CACHE[key] = result
+        _RENDER_CACHE_BYTES += size
+        while _RENDER_CACHE_BYTES > _RENDER_CACHE_MAXBYTES:
+            _, evicted = _RENDER_CACHE.popitem(last=False)
+            _RENDER_CACHE_BYTES -= len(evicted)
+
+def _render_cache_clear() -> None:
+    global _RENDER_CACHE_BYTES
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE.clear()
+        _RENDER_CACHE_BYTES = 0
+
+def _first_valid_loop(levels: np.ndarray) -> np.ndarray:
+    """First non-NaN value of each row (NaN when a row has none)"""
+    out = np.full(levels.shape[0], np.nan, dtype=levels.dtype)
+    for i in range(levels.shape[0]):
+        for j in range(levels.shape[1]):
+            if not np.isnan(levels[i, j]):
+                out[i] = levels[i, j]
+                break
+    return out
+
+def _first_valid_numpy(levels: np.ndarray) -> np.ndarray:
+    """NumPy fallback for _first_valid_loop when numba is unavailable"""
+    first = (~np.isnan(levels)).argmax(axis=1)
+    # Rows with no valid value index column 0, which is NaN already
+    return levels[np.arange(levels.shape[0]), first]
+
+# Compiled once and cached on disk so worker restarts skip the JIT step
+_first_valid = njit(cache=True)(_first_valid_loop) if njit is not None else _first_valid_numpy
+
 class ArgoVisualizer:
     """Visualization generator for ARGO oceanographic data"""
 
-    def __init__(self):
+    # How plotly.js is referenced by generated HTML fragments: 'cdn' emits a
+    # <script src> tag instead of inlining the ~3.5 MB bundle in every figure
+    PLOTLY_JS_MODE = 'cdn'
+
+    # Upper bound on vertical levels sent to the browser per profile trace
+    MAX_POINTS_PER_PROFILE = 2000
+
+    # Above this many profiles the map is rasterized with Datashader (when
+    # installed) instead of shipping one Scattergeo marker per float
+    DATASHADER_THRESHOLD = 5000
+
+    # Dashboard panels: subplot position, title and axis labels (None = geo panel)
+    DASHBOARD_POSITIONS = {
+        'temperature': (1, 1),
+        'salinity': (1, 2),
+        'ts_diagram': (2, 1),
+        'geographic': (2, 2)
+    }
+    DASHBOARD_TITLES = {
+        'temperature': 'Temperature Profiles',
+        'salinity': 'Salinity Profiles',
+        'ts_diagram': 'T-S Diagram',
+        'geographic': 'Geographic Distribution'
+    }
+    DASHBOARD_AXES = {
+        'temperature': {'x': 'Temperature (°C)', 'y': 'Depth (m)', 'reversed': True},
+        'salinity': {'x': 'Salinity (PSU)', 'y': 'Depth (m)', 'reversed': True},
+        'ts_diagram': {'x': 'Salinity (PSU)', 'y': 'Temperature (°C)'},
+        'geographic': None
+    }
+
+    # Pillow encoder options for matplotlib image output, keyed by format
+    IMAGE_SAVE_OPTIONS = {
+        'webp': {'lossless': True},
+        'png': {'optimize': True, 'compress_level': 9}
+    }
+
+    def __init__(self, image_format: str = 'webp', plotly_output: str = 'html'):
+        # Matplotlib output format - use 'png' for clients without WebP support
+        self.image_format = image_format
+
+        # Plotly output format: 'html' returns an embeddable fragment (what the
+        # chat responses and frontend consume today); 'json' is opt-in and
+        # returns the figure spec ({"data", "layout"}) for Plotly.newPlot
+        self.plotly_output = plotly_output
+
+        # Qualitative trace palettes, resolved once instead of on every plot
+        self._colors_set3 = tuple(px.colors.qualitative.Set3)
+        self._colors_set1 = tuple(px.colors.qualitative.Set1)
+        self._colors_prism = tuple(px.colors.qualitative.Prism)
+
         # Custom colormap for ocean data
         self.ocean_colormap = LinearSegmentedColormap.from_list(
             'ocean', ['#1e3a8a', '#3b82f6', '#06b6d4', '#10b981', '#f59e0b', '#ef4444']
@@ -35,17 +178,80 @@ class ArgoVisualizer:
                 'paper_bgcolor': 'rgba(0,0,0,0)',
                 'plot_bgcolor': 'rgba(0,0,0,0)',
                 'font': {'family': 'Arial, sans-serif', 'size': 12, 'color': '#1f2937'},
-                'margin': {'l': 60, 'r': 60, 't': 80, 'b': 60}
+                'margin': {'l': 60, 'r': 60, 't': 80, 'b': 60},
+                # Constant uirevision keeps client zoom/pan across figure updates
+                'uirevision': 'argo'
             }
         }
 
+    def _fig_to_payload(self, fig: go.Figure) -> str:
+        """Serialize a plotly figure for an API response"""
+        if self.plotly_output == 'html':
+            return fig.to_html(full_html=False, include_plotlyjs=self.PLOTLY_JS_MODE, validate=False)
+        # engine='auto' uses orjson when it is installed, stdlib json otherwise
+        return pio.to_json(fig, validate=False, engine='auto')
+
+    def _fig_to_data_uri(self, fig: Figure, dpi: int = 100) -> str:
+        """Encode a matplotlib figure as a base64 data URI in the configured image format"""
+        img_buffer = io.BytesIO()
+        fig.savefig(img_buffer, format=self.image_format, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs=self.IMAGE_SAVE_OPTIONS.get(self.image_format))
+
+        # Base64 output is pure ASCII - skip the UTF-8 decoder
+        img_base64 = base64.b64encode(img_buffer.getbuffer()).decode('ascii')
+        return f"data:image/{self.image_format};base64,{img_base64}"
+
+    def _cached_render(self, kind: str, profiles: List[Dict], output_format: str,
+                       render: Callable[[List[Dict]], str]) -> str:
+        """Return a rendered plot from the LRU cache, rendering it on a miss"""
+        key = self._render_cache_key(kind, profiles, output_format)
+        if key is not None:
+            cached = _render_cache_get(key)
+            if cached is not None:
+                return cached
+
+        result = render(profiles)
+        if result and key is not None:
+            _render_cache_put(key, result)
+        return result
+
+    def _render_cache_key(self, kind: str, profiles: List[Dict], output_format: str) -> Optional[str]:
+        """Hash of the profile identities plus everything that changes the rendered output
+
+        Returns None (do not cache) when the profiles carry no identifying fields.
+        """
+        identity = [tuple(p.get(field) for field in _PROFILE_ID_FIELDS) for p in profiles]
+        if not any(value is not None for row in identity for value in row):
+            return None
+
+        content = json.dumps(
+            [kind, output_format, self.plotly_output, self.image_format, identity],
+            default=_cache_key_default
+        ).encode('utf-8')
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _as_f32(values) -> np.ndarray:
+        """Convert a measurement list to float32 so plotly can base64-encode it"""
+        return np.asarray(values, dtype=np.float32)
+
+    def _downsample(self, *arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Evenly decimate aligned profile arrays to at most MAX_POINTS_PER_PROFILE points"""
+        n = len(arrays[0])
+        if n <= self.MAX_POINTS_PER_PROFILE:
+            return arrays
+        # linspace keeps the first (surface) and last (deepest) level
+        idx = np.linspace(0, n - 1, self.MAX_POINTS_PER_PROFILE).astype(np.intp)
+        return tuple(arr[idx] for arr in arrays)
+
     def create_temperature_profile_plot(self, profiles: List[Dict], output_format: str = 'plotly') -> str:
         """Create temperature vs depth profile plot"""
         try:
             if output_format == 'plotly':
-                return self._create_temperature_profile_plotly(profiles)
+                render = self._create_temperature_profile_plotly
             else:
-                return self._create_temperature_profile_matplotlib(profiles)
+                render = self._create_temperature_profile_matplotlib
+            return self._cached_render('temperature_profile', profiles, output_format, render)
         except Exception as e:
             logger.error(f"Error creating temperature profile plot: {e}")
             return ""
@@ -54,9 +260,10 @@ class ArgoVisualizer:
         """Create salinity vs depth profile plot"""
         try:
             if output_format == 'plotly':
-                return self._create_salinity_profile_plotly(profiles)
+                render = self._create_salinity_profile_plotly
             else:
-                return self._create_salinity_profile_matplotlib(profiles)
+                render = self._create_salinity_profile_matplotlib
+            return self._cached_render('salinity_profile', profiles, output_format, render)
         except Exception as e:
             logger.error(f"Error creating salinity profile plot: {e}")
             return ""
@@ -65,9 +272,10 @@ class ArgoVisualizer:
         """Create Temperature-Salinity diagram"""
         try:
             if output_format == 'plotly':
-                return self._create_ts_diagram_plotly(profiles)
+                render = self._create_ts_diagram_plotly
             else:
-                return self._create_ts_diagram_matplotlib(profiles)
+                render = self._create_ts_diagram_matplotlib
+            return self._cached_render('ts_diagram', profiles, output_format, render)
         except Exception as e:
             logger.error(f"Error creating TS diagram: {e}")
             return ""
@@ -76,9 +284,10 @@ class ArgoVisualizer:
         """Create geographic map view of profiles"""
         try:
             if output_format == 'plotly':
-                return self._create_map_view_plotly(profiles)
+                render = self._create_map_view_plotly
             else:
-                return self._create_map_view_matplotlib(profiles)
+                render = self._create_map_view_matplotlib
+            return self._cached_render('map_view', profiles, output_format, render)
         except Exception as e:
             logger.error(f"Error creating map view: {e}")
             return ""
@@ -87,13 +296,60 @@ class ArgoVisualizer:
         """Create time series plot of surface measurements"""
         try:
             if output_format == 'plotly':
-                return self._create_time_series_plotly(profiles)
+                render = self._create_time_series_plotly
             else:
-                return self._create_time_series_matplotlib(profiles)
+                render = self._create_time_series_matplotlib
+            return self._cached_render('time_series', profiles, output_format, render)
         except Exception as e:
             logger.error(f"Error creating time series plot: {e}")
             return ""
 
+    @staticmethod
+    def _profiles_with(profiles: List[Dict], n: int, *keys: str) -> List[Dict]:
+        """First n profiles that have non-empty data for every key, without slicing the input"""
+        return list(itertools.islice(
+            (p for p in profiles if all(p.get(key) for key in keys)), n
+        ))
+
+    def _depth_profiles(self, profiles: List[Dict], value_key: str, colors,
+                        limit: int = 10) -> Iterator[Tuple[str, str, np.ndarray, np.ndarray]]:
+        """Yield (label, color, values, depths) for up to `limit` value-vs-depth profiles"""
+        for i, profile in enumerate(self._profiles_with(profiles, limit, value_key, 'pressure_data')):
+            values = profile[value_key]
+            pres_data = profile['pressure_data']
+            n = min(len(values), len(pres_data))
+            label = f"Float {profile.get('float_id', 'N/A')} - Cycle {profile.get('cycle_number', 'N/A')}"
+
+            # Reverse pressure for depth (surface at top)
+            x, y = self._downsample(self._as_f32(values[:n]), -self._as_f32(pres_data[:n]))
+            yield label, colors[i % len(colors)], x, y
+
+    @staticmethod
+    def _pack_levels(series) -> np.ndarray:
+        """Pack ragged per-profile lists into a NaN-padded (profiles x levels) float32 array"""
+        arrays = [np.asarray(v if v else [], dtype=np.float32) for v in series]
+        width = max((len(a) for a in arrays), default=0)
+        levels = np.full((len(arrays), max(width, 1)), np.nan, dtype=np.float32)
+        for i, a in enumerate(arrays):
+            levels[i, :len(a)] = a
+        return levels
+
+    def _surface_time_series(self, profiles: List[Dict]) -> pd.DataFrame:
+        """Surface temperature/salinity per profile date, with dates parsed in one vectorized pass"""
+        rows = [p for p in profiles if 'profile_date' in p and 'temperature_data' in p]
+        df = pd.DataFrame({
+            'profile_date': [p['profile_date'] for p in rows],
+            'temperature_data': [p['temperature_data'] for p in rows],
+            'salinity_data': [p.get('salinity_data') for p in rows]
+        })
+
+        df['date'] = pd.to_datetime(df['profile_date'], utc=True, format='ISO8601', errors='coerce')
+        # Surface value = first valid measurement of each profile; empty/missing -> NaN
+        df['surf_temp'] = _first_valid(self._pack_levels(df['temperature_data']))
+        df['surf_sal'] = _first_valid(self._pack_levels(df['salinity_data']))
+
+        return df.dropna(subset=['date'])[['date', 'surf_temp', 'surf_sal']]
+
     def _create_temperature_profile_plotly(self, profiles: List[Dict]) -> str:
         """Create temperature profile using Plotly"""
         fig = make_subplots(
@@ -102,33 +358,27 @@ class ArgoVisualizer:
             specs=[[{"type": "scatter"}]]
         )
 
-        colors = px.colors.qualitative.Set3
-
-        for i, profile in enumerate(profiles[:10]):  # Limit to 10 profiles for clarity
-            if 'temperature_data' in profile and 'pressure_data' in profile:
-                temp_data = profile['temperature_data']
-                pres_data = profile['pressure_data']
-
-                if temp_data and pres_data:
-                    # Reverse pressure for depth (surface at top)
-                    depth_data = [-p for p in pres_data]
-
-                    fig.add_trace(
-                        go.Scatter(
-                            x=temp_data,
-                            y=depth_data,
-                            mode='lines+markers',
-                            name=f"Float {profile.get('float_id', 'N/A')} - Cycle {profile.get('cycle_number', 'N/A')}",
-                            line=dict(color=colors[i % len(colors)], width=2),
-                            marker=dict(size=4),
-                            hovertemplate=
-                                "Temperature: %{x:.2f}°C<br>" +
-                                "Depth: %{y:.1f} m<br>" +
-                                "Float: " + str(profile.get('float_id', 'N/A')) + "<br>" +
-                                "<extra></extra>"
-                        ),
-                        row=1, col=1
-                    )
+        colors = self._colors_set3
+
+        # One WebGL trace per profile (limit 10 for clarity) - float32 x/y are sent as
+        # typed arrays, and the label lives in the trace name rather than per point
+        for label, color, x, y in self._depth_profiles(profiles, 'temperature_data', colors):
+            fig.add_trace(
+                go.Scattergl(
+                    x=x,
+                    y=y,
+                    mode='lines+markers',
+                    name=label,
+                    line=dict(color=color, width=2),
+                    marker=dict(size=4),
+                    hovertemplate=
+                        "Temperature: %{x:.2f}°C<br>" +
+                        "Depth: %{y:.1f} m<br>" +
+                        label + "<br>" +
+                        "<extra></extra>"
+                ),
+                row=1, col=1
+            )
 
         fig.update_layout(
             **self.ocean_template['layout'],
@@ -141,7 +391,7 @@ class ArgoVisualizer:
 
         fig.update_yaxes(autorange="reversed")  # Depth increases downward
 
-        return fig.to_html(full_html=False, include_plotlyjs=True)
+        return self._fig_to_payload(fig)
 
     def _create_salinity_profile_plotly(self, profiles: List[Dict]) -> str:
         """Create salinity profile using Plotly"""
@@ -151,32 +401,25 @@ class ArgoVisualizer:
             specs=[[{"type": "scatter"}]]
         )
 
-        colors = px.colors.qualitative.Set1
-
-        for i, profile in enumerate(profiles[:10]):
-            if 'salinity_data' in profile and 'pressure_data' in profile:
-                sal_data = profile['salinity_data']
-                pres_data = profile['pressure_data']
-
-                if sal_data and pres_data:
-                    depth_data = [-p for p in pres_data]
-
-                    fig.add_trace(
-                        go.Scatter(
-                            x=sal_data,
-                            y=depth_data,
-                            mode='lines+markers',
-                            name=f"Float {profile.get('float_id', 'N/A')} - Cycle {profile.get('cycle_number', 'N/A')}",
-                            line=dict(color=colors[i % len(colors)], width=2),
-                            marker=dict(size=4),
-                            hovertemplate=
-                                "Salinity: %{x:.3f} PSU<br>" +
-                                "Depth: %{y:.1f} m<br>" +
-                                "Float: " + str(profile.get('float_id', 'N/A')) + "<br>" +
-                                "<extra></extra>"
-                        ),
-                        row=1, col=1
-                    )
+        colors = self._colors_set1
+
+        for label, color, x, y in self._depth_profiles(profiles, 'salinity_data', colors):
+            fig.add_trace(
+                go.Scattergl(
+                    x=x,
+                    y=y,
+                    mode='lines+markers',
+                    name=label,
+                    line=dict(color=color, width=2),
+                    marker=dict(size=4),
+                    hovertemplate=
+                        "Salinity: %{x:.3f} PSU<br>" +
+                        "Depth: %{y:.1f} m<br>" +
+                        label + "<br>" +
+                        "<extra></extra>"
+                ),
+                row=1, col=1
+            )
 
         fig.update_layout(
             **self.ocean_template['layout'],
@@ -189,40 +432,39 @@ class ArgoVisualizer:
 
         fig.update_yaxes(autorange="reversed")
 
-        return fig.to_html(full_html=False, include_plotlyjs=True)
+        return self._fig_to_payload(fig)
 
     def _create_ts_diagram_plotly(self, profiles: List[Dict]) -> str:
         """Create Temperature-Salinity diagram using Plotly"""
         fig = go.Figure()
 
-        colors = px.colors.qualitative.Prism
-
-        for i, profile in enumerate(profiles[:8]):  # Limit for clarity
-            if 'temperature_data' in profile and 'salinity_data' in profile:
-                temp_data = profile['temperature_data']
-                sal_data = profile['salinity_data']
-
-                if temp_data and sal_data:
-                    # Use minimum length to match data
-                    min_len = min(len(temp_data), len(sal_data))
-                    temp_subset = temp_data[:min_len]
-                    sal_subset = sal_data[:min_len]
-
-                    fig.add_trace(
-                        go.Scatter(
-                            x=sal_subset,
-                            y=temp_subset,
-                            mode='lines+markers',
-                            name=f"Float {profile.get('float_id', 'N/A')} - Cycle {profile.get('cycle_number', 'N/A')}",
-                            line=dict(color=colors[i % len(colors)], width=2),
-                            marker=dict(size=3),
-                            hovertemplate=
-                                "Salinity: %{x:.3f} PSU<br>" +
-                                "Temperature: %{y:.2f}°C<br>" +
-                                "Float: " + str(profile.get('float_id', 'N/A')) + "<br>" +
-                                "<extra></extra>"
-                        )
-                    )
+        colors = self._colors_prism
+
+        for i, profile in enumerate(self._profiles_with(profiles, 8, 'temperature_data', 'salinity_data')):  # Limit for clarity
+            temp_data = profile['temperature_data']
+            sal_data = profile['salinity_data']
+
+            # Use minimum length to match data
+            min_len = min(len(temp_data), len(sal_data))
+            temp_subset, sal_subset = self._downsample(
+                self._as_f32(temp_data[:min_len]), self._as_f32(sal_data[:min_len])
+            )
+
+            fig.add_trace(
+                go.Scattergl(
+                    x=sal_subset,
+                    y=temp_subset,
+                    mode='lines+markers',
+                    name=f"Float {profile.get('float_id', 'N/A')} - Cycle {profile.get('cycle_number', 'N/A')}",
+                    line=dict(color=colors[i % len(colors)], width=2),
+                    marker=dict(size=3),
+                    hovertemplate=
+                        "Salinity: %{x:.3f} PSU<br>" +
+                        "Temperature: %{y:.2f}°C<br>" +
+                        "Float: " + str(profile.get('float_id', 'N/A')) + "<br>" +
+                        "<extra></extra>"
+                )
+            )
 
         fig.update_layout(
             **self.ocean_template['layout'],
@@ -233,10 +475,13 @@ class ArgoVisualizer:
             showlegend=True
         )
 
-        return fig.to_html(full_html=False, include_plotlyjs=True)
+        return self._fig_to_payload(fig)
 
     def _create_map_view_plotly(self, profiles: List[Dict]) -> str:
         """Create geographic map view using Plotly"""
+        if ds is not None and len(profiles) > self.DATASHADER_THRESHOLD:
+            return self._create_map_view_datashader(profiles)
+
         fig = go.Figure()
 
         # Extract coordinates
@@ -257,8 +502,8 @@ class ArgoVisualizer:
         if lats and lons:
             fig.add_trace(
                 go.Scattergeo(
-                    lat=lats,
-                    lon=lons,
+                    lat=self._as_f32(lats),
+                    lon=self._as_f32(lons),
                     mode='markers',
                     marker=dict(
                         size=8,
@@ -283,7 +528,55 @@ class ArgoVisualizer:
             hovermode='closest'
         )
 
-        return fig.to_html(full_html=False, include_plotlyjs=True)
+        return self._fig_to_payload(fig)
+
+    def _create_map_view_datashader(self, profiles: List[Dict]) -> str:
+        """Create map view for large profile sets by rasterizing locations with Datashader"""
+        df = pd.DataFrame({
+            'lat': [p['latitude'] for p in profiles if 'latitude' in p and 'longitude' in p],
+            'lon': [p['longitude'] for p in profiles if 'latitude' in p and 'longitude' in p]
+        }, dtype=np.float32).dropna()
+
+        fig = go.Figure()
+
+        if not df.empty:
+            lon_min, lon_max = float(df['lon'].min()), float(df['lon'].max())
+            lat_min, lat_max = float(df['lat'].min()), float(df['lat'].max())
+            # Avoid a zero-width canvas when every float sits on one meridian/parallel
+            if lon_min == lon_max:
+                lon_min, lon_max = lon_min - 1, lon_max + 1
+            if lat_min == lat_max:
+                lat_min, lat_max = lat_min - 1, lat_max + 1
+
+            cvs = ds.Canvas(plot_width=1000, plot_height=500,
+                            x_range=(lon_min, lon_max), y_range=(lat_min, lat_max))
+            agg = cvs.points(df, 'lon', 'lat')
+            img = tf.shade(agg, cmap=['#3b82f6', '#06b6d4', '#10b981', '#f59e0b', '#ef4444'],
+                           how='eq_hist').to_pil()
+
+            img_buffer = io.BytesIO()
+            img.save(img_buffer, format='PNG')
+            img_base64 = base64.b64encode(img_buffer.getbuffer()).decode('ascii')
+
+            # Raster stretched over the lon/lat extent of the canvas
+            fig.add_layout_image(
+                source=f"data:image/png;base64,{img_base64}",
+                xref='x', yref='y',
+                x=lon_min, y=lat_max,
+                sizex=lon_max - lon_min, sizey=lat_max - lat_min,
+                sizing='stretch',
+                layer='below'
+            )
+            fig.update_xaxes(range=[lon_min, lon_max], title_text='Longitude')
+            fig.update_yaxes(range=[lat_min, lat_max], title_text='Latitude',
+                             scaleanchor='x', scaleratio=1)
+
+        fig.update_layout(
+            **self.ocean_template['layout'],
+            title=f'ARGO Float Locations ({len(df):,} profiles)'
+        )
+
+        return self._fig_to_payload(fig)
 
     def _create_time_series_plotly(self, profiles: List[Dict]) -> str:
         """Create time series plot using Plotly"""
@@ -293,73 +586,37 @@ class ArgoVisualizer:
             specs=[[{"type": "scatter"}], [{"type": "scatter"}]]
         )
 
-        # Extract time series data
-        dates = []
-        surf_temps = []
-        surf_sals = []
-
-        for profile in profiles:
-            if 'profile_date' in profile and 'temperature_data' in profile:
-                try:
-                    # Parse date
-                    if isinstance(profile['profile_date'], str):
-                        date = datetime.fromisoformat(profile['profile_date'].replace('Z', '+00:00'))
-                    else:
-                        date = profile['profile_date']
-
-                    dates.append(date)
-
-                    # Get surface temperature (first valid measurement)
-                    temp_data = profile['temperature_data']
-                    if temp_data:
-                        surf_temps.append(temp_data[0])
-                    else:
-                        surf_temps.append(None)
-
-                    # Get surface salinity (first valid measurement)
-                    sal_data = profile.get('salinity_data', [])
-                    if sal_data:
-                        surf_sals.append(sal_data[0])
-                    else:
-                        surf_sals.append(None)
-
-                except Exception as e:
-                    logger.warning(f"Error parsing profile date: {e}")
-                    continue
+        series = self._surface_time_series(profiles)
 
         # Add temperature time series
-        if dates and surf_temps:
-            valid_data = [(d, t) for d, t in zip(dates, surf_temps) if t is not None]
-            if valid_data:
-                valid_dates, valid_temps = zip(*valid_data)
-                fig.add_trace(
-                    go.Scatter(
-                        x=valid_dates,
-                        y=valid_temps,
-                        mode='lines+markers',
-                        name='Surface Temperature',
-                        line=dict(color='red', width=2),
-                        marker=dict(size=4)
-                    ),
-                    row=1, col=1
-                )
+        temps = series.dropna(subset=['surf_temp'])
+        if not temps.empty:
+            fig.add_trace(
+                go.Scattergl(
+                    x=temps['date'],
+                    y=temps['surf_temp'].to_numpy(dtype=np.float32),
+                    mode='lines+markers',
+                    name='Surface Temperature',
+                    line=dict(color='red', width=2),
+                    marker=dict(size=4)
+                ),
+                row=1, col=1
+            )
 
         # Add salinity time series
-        if dates and surf_sals:
-            valid_data = [(d, s) for d, s in zip(dates, surf_sals) if s is not None]
-            if valid_data:
-                valid_dates, valid_sals = zip(*valid_data)
-                fig.add_trace(
-                    go.Scatter(
-                        x=valid_dates,
-                        y=valid_sals,
-                        mode='lines+markers',
-                        name='Surface Salinity',
-                        line=dict(color='blue', width=2),
-                        marker=dict(size=4)
-                    ),
-                    row=2, col=1
-                )
+        sals = series.dropna(subset=['surf_sal'])
+        if not sals.empty:
+            fig.add_trace(
+                go.Scattergl(
+                    x=sals['date'],
+                    y=sals['surf_sal'].to_numpy(dtype=np.float32),
+                    mode='lines+markers',
+                    name='Surface Salinity',
+                    line=dict(color='blue', width=2),
+                    marker=dict(size=4)
+                ),
+                row=2, col=1
+            )
 
         fig.update_layout(
             **self.ocean_template['layout'],
@@ -372,26 +629,24 @@ class ArgoVisualizer:
         fig.update_yaxes(title_text="Temperature (°C)", row=1, col=1)
         fig.update_yaxes(title_text="Salinity (PSU)", row=2, col=1)
 
-        return fig.to_html(full_html=False, include_plotlyjs=True)
+        return self._fig_to_payload(fig)
 
     def _create_temperature_profile_matplotlib(self, profiles: List[Dict]) -> str:
         """Create temperature profile using Matplotlib"""
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        colors = plt.cm.tab10(np.linspace(0, 1, len(profiles[:8])))
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
-        for i, profile in enumerate(profiles[:8]):
-            if 'temperature_data' in profile and 'pressure_data' in profile:
-                temp_data = profile['temperature_data']
-                pres_data = profile['pressure_data']
+        plotted = self._profiles_with(profiles, 8, 'temperature_data', 'pressure_data')
+        colors = matplotlib.colormaps['tab10'](np.linspace(0, 1, len(plotted)))
 
-                if temp_data and pres_data:
-                    depth_data = [-p for p in pres_data]
+        for i, profile in enumerate(plotted):
+            depth_data = -self._as_f32(profile['pressure_data'])
 
-                    ax.plot(temp_data, depth_data,
-                           marker='o', markersize=3,
-                           color=colors[i],
-                           label=f"Float {profile.get('float_id', 'N/A')}")
+            ax.plot(profile['temperature_data'], depth_data,
+                   marker='o', markersize=3,
+                   color=colors[i],
+                   label=f"Float {profile.get('float_id', 'N/A')}")
 
         ax.set_xlabel('Temperature (°C)')
         ax.set_ylabel('Depth (m)')
@@ -400,32 +655,24 @@ class ArgoVisualizer:
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
 
         # Save to base64 string
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
-        img_buffer.seek(0)
-
-        img_base64 = base64.b64encode(img_buffer.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        return self._fig_to_data_uri(fig)
 
     def _create_salinity_profile_matplotlib(self, profiles: List[Dict]) -> str:
         """Create salinity profile using Matplotlib"""
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        colors = plt.cm.Set1(np.linspace(0, 1, len(profiles[:8])))
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
-        for i, profile in enumerate(profiles[:8]):
-            if 'salinity_data' in profile and 'pressure_data' in profile:
-                sal_data = profile['salinity_data']
-                pres_data = profile['pressure_data']
+        plotted = self._profiles_with(profiles, 8, 'salinity_data', 'pressure_data')
+        colors = matplotlib.colormaps['Set1'](np.linspace(0, 1, len(plotted)))
 
-                if sal_data and pres_data:
-                    depth_data = [-p for p in pres_data]
+        for i, profile in enumerate(plotted):
+            depth_data = -self._as_f32(profile['pressure_data'])
 
-                    ax.plot(sal_data, depth_data,
-                           marker='s', markersize=3,
-                           color=colors[i],
-                           label=f"Float {profile.get('float_id', 'N/A')}")
+            ax.plot(profile['salinity_data'], depth_data,
+                   marker='s', markersize=3,
+                   color=colors[i],
+                   label=f"Float {profile.get('float_id', 'N/A')}")
 
         ax.set_xlabel('Salinity (PSU)')
         ax.set_ylabel('Depth (m)')
@@ -433,30 +680,25 @@ class ArgoVisualizer:
         ax.grid(True, alpha=0.3)
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
 
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
-        img_buffer.seek(0)
-
-        img_base64 = base64.b64encode(img_buffer.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        return self._fig_to_data_uri(fig)
 
     def _create_ts_diagram_matplotlib(self, profiles: List[Dict]) -> str:
         """Create Temperature-Salinity diagram using Matplotlib"""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig = Figure(figsize=(8, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
-        colors = plt.cm.viridis(np.linspace(0, 1, len(profiles[:6])))
+        plotted = self._profiles_with(profiles, 6, 'temperature_data', 'salinity_data')
+        colors = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(plotted)))
 
-        for i, profile in enumerate(profiles[:6]):
-            if 'temperature_data' in profile and 'salinity_data' in profile:
-                temp_data = profile['temperature_data']
-                sal_data = profile['salinity_data']
+        for i, profile in enumerate(plotted):
+            temp_data = profile['temperature_data']
+            sal_data = profile['salinity_data']
 
-                if temp_data and sal_data:
-                    min_len = min(len(temp_data), len(sal_data))
-                    ax.scatter(sal_data[:min_len], temp_data[:min_len],
-                              c=[colors[i]] * min_len, s=20, alpha=0.7,
-                              label=f"Float {profile.get('float_id', 'N/A')}")
+            min_len = min(len(temp_data), len(sal_data))
+            ax.scatter(sal_data[:min_len], temp_data[:min_len],
+                      c=[colors[i]] * min_len, s=20, alpha=0.7,
+                      label=f"Float {profile.get('float_id', 'N/A')}")
 
         ax.set_xlabel('Salinity (PSU)')
         ax.set_ylabel('Temperature (°C)')
@@ -464,17 +706,13 @@ class ArgoVisualizer:
         ax.grid(True, alpha=0.3)
         ax.legend()
 
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
-        img_buffer.seek(0)
-
-        img_base64 = base64.b64encode(img_buffer.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        return self._fig_to_data_uri(fig)
 
     def _create_map_view_matplotlib(self, profiles: List[Dict]) -> str:
         """Create map view using Matplotlib"""
-        fig, ax = plt.subplots(figsize=(12, 8), subplot_kw={'projection': ' PlateCarree'})
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots(subplot_kw={'projection': ' PlateCarree'})
 
         # Extract coordinates
         lats = []
@@ -494,192 +732,205 @@ class ArgoVisualizer:
         ax.set_xlabel('Longitude')
         ax.set_ylabel('Latitude')
 
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
-        img_buffer.seek(0)
-
-        img_base64 = base64.b64encode(img_buffer.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        return self._fig_to_data_uri(fig)
 
     def _create_time_series_matplotlib(self, profiles: List[Dict]) -> str:
         """Create time series plot using Matplotlib"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax1, ax2 = fig.subplots(2, 1)
 
-        # Extract time series data
-        dates = []
-        surf_temps = []
-        surf_sals = []
-
-        for profile in profiles:
-            if 'profile_date' in profile and 'temperature_data' in profile:
-                try:
-                    if isinstance(profile['profile_date'], str):
-                        date = datetime.fromisoformat(profile['profile_date'].replace('Z', '+00:00'))
-                    else:
-                        date = profile['profile_date']
-
-                    dates.append(date)
-
-                    temp_data = profile['temperature_data']
-                    if temp_data:
-                        surf_temps.append(temp_data[0])
-                    else:
-                        surf_temps.append(None)
-
-                    sal_data = profile.get('salinity_data', [])
-                    if sal_data:
-                        surf_sals.append(sal_data[0])
-                    else:
-                        surf_sals.append(None)
-
-                except Exception as e:
-                    continue
+        series = self._surface_time_series(profiles)
 
         # Plot temperature
-        if dates and surf_temps:
-            valid_data = [(d, t) for d, t in zip(dates, surf_temps) if t is not None]
-            if valid_data:
-                valid_dates, valid_temps = zip(*valid_data)
-                ax1.plot(valid_dates, valid_temps, 'r-o', markersize=4, linewidth=2)
-                ax1.set_ylabel('Temperature (°C)')
-                ax1.set_title('Surface Measurements Time Series')
-                ax1.grid(True, alpha=0.3)
+        temps = series.dropna(subset=['surf_temp'])
+        if not temps.empty:
+            ax1.plot(temps['date'], temps['surf_temp'], 'r-o', markersize=4, linewidth=2)
+            ax1.set_ylabel('Temperature (°C)')
+            ax1.set_title('Surface Measurements Time Series')
+            ax1.grid(True, alpha=0.3)
 
         # Plot salinity
-        if dates and surf_sals:
-            valid_data = [(d, s) for d, s in zip(dates, surf_sals) if s is not None]
-            if valid_data:
-                valid_dates, valid_sals = zip(*valid_data)
-                ax2.plot(valid_dates, valid_sals, 'b-s', markersize=4, linewidth=2)
-                ax2.set_ylabel('Salinity (PSU)')
-                ax2.set_xlabel('Date')
-                ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        sals = series.dropna(subset=['surf_sal'])
+        if not sals.empty:
+            ax2.plot(sals['date'], sals['surf_sal'], 'b-s', markersize=4, linewidth=2)
+            ax2.set_ylabel('Salinity (PSU)')
+            ax2.set_xlabel('Date')
+            ax2.grid(True, alpha=0.3)
 
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
-        img_buffer.seek(0)
+        fig.tight_layout()
 
-        img_base64 = base64.b64encode(img_buffer.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        return self._fig_to_data_uri(fig)
 
     def create_comprehensive_dashboard(self, profiles: List[Dict]) -> str:
         """Create comprehensive dashboard with multiple visualizations"""
         try:
-            # Create subplots
-            fig = make_subplots(
-                rows=2, cols=2,
-                subplot_titles=['Temperature Profiles', 'Salinity Profiles', 'T-S Diagram', 'Geographic Distribution'],
-                specs=[
-                    [{"type": "scatter"}, {"type": "scatter"}],
-                    [{"type": "scatter"}, {"type": "scatter"}]
-                ],
-                vertical_spacing=0.1,
-                horizontal_spacing=0.1
+            return self._cached_render('dashboard', profiles, 'plotly', self._create_comprehensive_dashboard)
+        except Exception as e:
+            logger.error(f"Error creating dashboard: {e}")
+            return ""
+
+    def _create_comprehensive_dashboard(self, profiles: List[Dict]) -> str:
+        """Create dashboard subplots using Plotly"""
+        # Create subplots
+        fig = make_subplots(
+            rows=2, cols=2,
+            subplot_titles=list(self.DASHBOARD_TITLES.values()),
+            specs=[
+                [{"type": "scatter"}, {"type": "scatter"}],
+                [{"type": "scatter"}, {"type": "geo"}]
+            ],
+            vertical_spacing=0.1,
+            horizontal_spacing=0.1
+        )
+
+        panels = self._dashboard_traces(profiles)
+
+        traces, rows, cols = [], [], []
+        for key, (row, col) in self.DASHBOARD_POSITIONS.items():
+            traces.extend(panels[key])
+            rows.extend([row] * len(panels[key]))
+            cols.extend([col] * len(panels[key]))
+
+        # One batched call instead of a validated add_trace per trace
+        if traces:
+            fig.add_traces(traces, rows=rows, cols=cols)
+
+        fig.update_layout(
+            **self.ocean_template['layout'],
+            title='ARGO Data Analysis Dashboard',
+            height=800,
+            hovermode='closest'
+        )
+
+        # Update axes
+        for key, (row, col) in self.DASHBOARD_POSITIONS.items():
+            axes = self.DASHBOARD_AXES[key]
+            if axes is None:
+                fig.update_geos(showcoastlines=True, row=row, col=col)
+                continue
+            fig.update_xaxes(title_text=axes['x'], row=row, col=col)
+            fig.update_yaxes(title_text=axes['y'], row=row, col=col)
+            if axes.get('reversed'):
+                fig.update_yaxes(autorange="reversed", row=row, col=col)
+
+        return self._fig_to_payload(fig)
+
+    def _dashboard_traces(self, profiles: List[Dict]) -> Dict[str, List]:
+        """Build the traces of every dashboard panel, keyed like DASHBOARD_POSITIONS"""
+        prepared = self._prepare_dashboard_data(profiles)
+
+        builders = {
+            'temperature': self._build_temp_traces,
+            'salinity': self._build_sal_traces,
+            'ts_diagram': self._build_ts_traces,
+            'geographic': self._build_geo_traces
+        }
+
+        # Panels only read the prepared arrays - build them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {key: executor.submit(fn, prepared) for key, fn in builders.items()}
+            return {key: future.result() for key, future in futures.items()}
+
+    def _prepare_dashboard_data(self, profiles: List[Dict]) -> Dict[str, Any]:
+        """Single pass over the profiles: each dict is read once and its arrays feed every panel"""
+        series, lats, lons = [], [], []
+        for i, profile in enumerate(profiles):
+            if i < 5:
+                temp_data = profile.get('temperature_data')
+                sal_data = profile.get('salinity_data')
+                pressure_data = profile.get('pressure_data')
+                series.append({
+                    'color': self._colors_set3[i],
+                    'name': f"Float {profile.get('float_id', 'N/A')}",
+                    'temps': self._as_f32(temp_data) if temp_data else None,
+                    'sals': self._as_f32(sal_data) if sal_data else None,
+                    'depths': -self._as_f32(pressure_data) if pressure_data else None
+                })
+
+            if 'latitude' in profile and 'longitude' in profile:
+                lats.append(profile['latitude'])
+                lons.append(profile['longitude'])
+
+        return {'series': series, 'lats': lats, 'lons': lons}
+
+    @staticmethod
+    def _build_temp_traces(prepared: Dict[str, Any]) -> List:
+        """Temperature vs depth panel"""
+        return [
+            go.Scattergl(
+                x=s['temps'], y=s['depths'],
+                mode='lines', line=dict(color=s['color'], width=2),
+                name=s['name'], showlegend=True
+            )
+            for s in prepared['series'] if s['temps'] is not None and s['depths'] is not None
+        ]
+
+    @staticmethod
+    def _build_sal_traces(prepared: Dict[str, Any]) -> List:
+        """Salinity vs depth panel"""
+        return [
+            go.Scattergl(
+                x=s['sals'], y=s['depths'],
+                mode='lines', line=dict(color=s['color'], width=2),
+                name=s['name'], showlegend=True
             )
+            for s in prepared['series'] if s['sals'] is not None and s['depths'] is not None
+        ]
+
+    @staticmethod
+    def _build_ts_traces(prepared: Dict[str, Any]) -> List:
+        """T-S diagram panel"""
+        traces = []
+        for s in prepared['series']:
+            if s['temps'] is not None and s['sals'] is not None:
+                min_len = min(len(s['temps']), len(s['sals']))
+                traces.append(go.Scattergl(
+                    x=s['sals'][:min_len], y=s['temps'][:min_len],
+                    mode='markers', marker=dict(color=s['color'], size=4),
+                    name=s['name'], showlegend=True
+                ))
+        return traces
+
+    @staticmethod
+    def _build_geo_traces(prepared: Dict[str, Any]) -> List:
+        """Geographic distribution panel"""
+        if not prepared['lats']:
+            return []
+        return [go.Scattergeo(
+            lat=prepared['lats'], lon=prepared['lons'],
+            mode='markers',
+            marker=dict(size=6, color='red', opacity=0.7),
+            name='Profile Locations',
+            showlegend=True
+        )]
 
-            colors = px.colors.qualitative.Set3
-
-            # Temperature profiles
-            for i, profile in enumerate(profiles[:5]):
-                if 'temperature_data' in profile and 'pressure_data' in profile:
-                    temp_data = profile['temperature_data']
-                    pres_data = profile['pressure_data']
-                    if temp_data and pres_data:
-                        depth_data = [-p for p in pres_data]
-                        fig.add_trace(
-                            go.Scatter(
-                                x=temp_data, y=depth_data,
-                                mode='lines', line=dict(color=colors[i], width=2),
-                                name=f"Float {profile.get('float_id', 'N/A')}",
-                                showlegend=True
-                            ),
-                            row=1, col=1
-                        )
-
-            # Salinity profiles
-            for i, profile in enumerate(profiles[:5]):
-                if 'salinity_data' in profile and 'pressure_data' in profile:
-                    sal_data = profile['salinity_data']
-                    pres_data = profile['pressure_data']
-                    if sal_data and pres_data:
-                        depth_data = [-p for p in pres_data]
-                        fig.add_trace(
-                            go.Scatter(
-                                x=sal_data, y=depth_data,
-                                mode='lines', line=dict(color=colors[i], width=2),
-                                name=f"Float {profile.get('float_id', 'N/A')}",
-                                showlegend=True
-                            ),
-                            row=1, col=2
-                        )
-
-            # T-S Diagram
-            for i, profile in enumerate(profiles[:5]):
-                if 'temperature_data' in profile and 'salinity_data' in profile:
-                    temp_data = profile['temperature_data']
-                    sal_data = profile['salinity_data']
-                    if temp_data and sal_data:
-                        min_len = min(len(temp_data), len(sal_data))
-                        fig.add_trace(
-                            go.Scatter(
-                                x=sal_data[:min_len], y=temp_data[:min_len],
-                                mode='markers', marker=dict(color=colors[i], size=4),
-                                name=f"Float {profile.get('float_id', 'N/A')}",
-                                showlegend=True
-                            ),
-                            row=2, col=1
-                        )
-
-            # Geographic distribution
-            lats = []
-            lons = []
-            for profile in profiles:
-                if 'latitude' in profile and 'longitude' in profile:
-                    lats.append(profile['latitude'])
-                    lons.append(profile['longitude'])
-
-            if lats and lons:
-                fig.add_trace(
-                    go.Scattergeo(
-                        lat=lats, lon=lons,
-                        mode='markers',
-                        marker=dict(size=6, color='red', opacity=0.7),
-                        name='Profile Locations',
-                        showlegend=True
-                    ),
-                    row=2, col=2
-                )
+    def iter_dashboard_panels(self, profiles: List[Dict]) -> Iterator[str]:
+        """Yield each dashboard panel as one NDJSON line ({"panel", "figure"})
 
+        Lets a StreamingResponse send the first panel while the rest are still
+        being serialized, instead of holding the whole dashboard in memory.
+        """
+        panels = self._dashboard_traces(profiles)
+        for key, title in self.DASHBOARD_TITLES.items():
+            fig = go.Figure(data=panels[key])
             fig.update_layout(
                 **self.ocean_template['layout'],
-                title='ARGO Data Analysis Dashboard',
-                height=800,
+                title=title,
                 hovermode='closest'
             )
 
-            # Update axes
-            fig.update_xaxes(title_text="Temperature (°C)", row=1, col=1)
-            fig.update_yaxes(title_text="Depth (m)", row=1, col=1)
-            fig.update_yaxes(autorange="reversed", row=1, col=1)
-
-            fig.update_xaxes(title_text="Salinity (PSU)", row=1, col=2)
-            fig.update_yaxes(title_text="Depth (m)", row=1, col=2)
-            fig.update_yaxes(autorange="reversed", row=1, col=2)
-
-            fig.update_xaxes(title_text="Salinity (PSU)", row=2, col=1)
-            fig.update_yaxes(title_text="Temperature (°C)", row=2, col=1)
-
-            fig.update_geos(showcoastlines=True, row=2, col=2)
-
-            return fig.to_html(full_html=False, include_plotlyjs=True)
+            axes = self.DASHBOARD_AXES[key]
+            if axes is None:
+                fig.update_geos(showcoastlines=True)
+            else:
+                fig.update_xaxes(title_text=axes['x'])
+                fig.update_yaxes(title_text=axes['y'])
+                if axes.get('reversed'):
+                    fig.update_yaxes(autorange="reversed")
 
-        except Exception as e:
-            logger.error(f"Error creating dashboard: {e}")
-            return ""
+            figure_json = pio.to_json(fig, validate=False, engine='auto')
+            yield f'{{"panel": "{key}", "figure": {figure_json}}}\n'
 
 def create_visualizer() -> ArgoVisualizer:
     """Create visualizer instance"""
@@ -2,11 +2,123 @@
 Compatibility layer for psycopg2cffi to work with Django
 Registers psycopg2cffi as psycopg2 and adds missing error classes, extensions, and sql modules
 """
+import importlib.util
+import re
 import sys
 import types
 
+# Matches the leading "PostgreSQL 13.2" of SELECT version() output
+_PG_VERSION_RE = re.compile(r'PostgreSQL (\d+)\.(\d+)')
+
+# Standard DB-API 2.0 exceptions, re-exported from psycopg2cffi
+_DBAPI_ERRORS = (
+    'Warning', 'Error', 'InterfaceError', 'DatabaseError',
+    'DataError', 'OperationalError', 'IntegrityError',
+    'InternalError', 'ProgrammingError', 'NotSupportedError'
+)
+
+# (psycopg2cffi.Error,), bound by setup_psycopg2_compat - empty until then,
+# which is fine as ConnectionInfo is only created after setup
+_DB_ERROR_TYPES = ()
+
+# PostgreSQL-specific error classes (Django requirements) -> DB-API base class
+_ERROR_ALIASES = {
+    'UniqueViolation': 'IntegrityError',
+    'ForeignKeyViolation': 'IntegrityError',
+    'CheckViolation': 'IntegrityError',
+    'NotNullViolation': 'IntegrityError',
+    'ExclusionViolation': 'IntegrityError',
+    'InvalidTextRepresentation': 'DataError',
+    'InvalidDatetimeFormat': 'DataError',
+    'NumericValueOutOfRange': 'DataError',
+    'DivisionByZero': 'DataError',
+    'ConnectionDoesNotExist': 'OperationalError',
+    'ConnectionException': 'OperationalError',
+    'DeadlockDetected': 'OperationalError',
+    'SerializationFailure': 'OperationalError',
+    'SyntaxError': 'ProgrammingError',
+    'UndefinedColumn': 'ProgrammingError',
+    'UndefinedTable': 'ProgrammingError',
+    'UndefinedFunction': 'ProgrammingError',
+    'InsufficientPrivilege': 'OperationalError',
+}
+
+class ConnectionInfo:
+    """Mock ConnectionInfo object for psycopg2cffi compatibility"""
+    def __init__(self, connection):
+        self._connection = connection
+        self._params = {}
+        self._server_version = None  # Immutable per connection - fetched once
+
+    @property
+    def server_version(self):
+        """Get PostgreSQL server version"""
+        if self._server_version is not None:
+            return self._server_version
+        if getattr(self._connection, 'closed', False):
+            return 130000  # Default to PostgreSQL 13.0
+
+        try:
+            # Get version from the connection; the cursor is closed even if fetchone fails
+            with self._connection.cursor() as cursor:
+                cursor.execute("SELECT version()")
+                version_string = cursor.fetchone()[0]
+
+            # Parse version number from string like "PostgreSQL 13.2..."
+            match = _PG_VERSION_RE.search(version_string)
+            if match:
+                major = int(match.group(1))
+                minor = int(match.group(2))
+                # Return as integer: major * 10000 + minor * 100
+                self._server_version = major * 10000 + minor * 100
+                return self._server_version
+            return 130000  # Default to PostgreSQL 13.0
+        except (*_DB_ERROR_TYPES, AttributeError, TypeError, ValueError):
+            return 130000  # Default to PostgreSQL 13.0
+
+    def parameter_status(self, param_name):
+        """Get connection parameter status (like TimeZone, client_encoding, etc.)"""
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(f"SHOW {param_name}")
+            result = cursor.fetchone()[0]
+            cursor.close()
+            return result
+        except:
+            # Return sensible defaults
+            defaults = {
+                'TimeZone': 'UTC',
+                'client_encoding': 'UTF8',
+                'server_encoding': 'UTF8',
+                'server_version': '13.0',
+            }
+            return defaults.get(param_name, '')
+
+def _connection_info(connection):
+    """Lazily attach a ConnectionInfo to a psycopg2cffi connection"""
+    info = connection.__dict__.get('_info')
+    if info is None:
+        info = connection.__dict__['_info'] = ConnectionInfo(connection)
+    return info
+
 def setup_psycopg2_compat():
     """Setup psycopg2cffi as a drop-in replacement for psycopg2"""
+    global _DB_ERROR_TYPES
+
+    # Local aliases for the globals used repeatedly below
+    modules = sys.modules
+    ModuleType = types.ModuleType
+
+    # Already installed by an earlier import (autoreloader, test discovery, fork)
+    if getattr(modules.get('psycopg2'), '_cffi_compat_installed', False):
+        _DB_ERROR_TYPES = (modules['psycopg2'].Error,)
+        return True
+
+    # Native psycopg2 without psycopg2cffi: nothing to patch. find_spec only
+    # consults the finders, so this skips the failed-import attempt below
+    if importlib.util.find_spec('psycopg2') and not importlib.util.find_spec('psycopg2cffi'):
+        return False
+
     try:
         # First, register psycopg2cffi as psycopg2
         from psycopg2cffi import compat
@@ -18,156 +130,65 @@ def setup_psycopg2_compat():
         # Import psycopg2 (which is now psycopg2cffi after compat.register())
         import psycopg2
         
-        # Import base exception classes from psycopg2cffi
-        from psycopg2cffi import (
-            Warning, Error, InterfaceError, DatabaseError,
-            DataError, OperationalError, IntegrityError,
-            InternalError, ProgrammingError, NotSupportedError
-        )
+        # Base exception classes from psycopg2cffi
+        exceptions = {name: getattr(psycopg2cffi, name) for name in _DBAPI_ERRORS}
+        _DB_ERROR_TYPES = (exceptions['Error'],)
         
         # Import extensions module if it exists
         try:
             from psycopg2cffi import extensions
         except ImportError:
-            extensions = types.ModuleType('extensions')
+            extensions = ModuleType('extensions')
             
         # Import or create sql module
         try:
             from psycopg2cffi import sql
         except ImportError:
             # Create a minimal sql module
-            sql = types.ModuleType('sql')
+            sql = ModuleType('sql')
         
         # Create comprehensive errors module
-        errors_module = types.ModuleType('errors')
-        
-        # Standard DB-API 2.0 exceptions
-        errors_module.Warning = Warning
-        errors_module.Error = Error
-        errors_module.InterfaceError = InterfaceError
-        errors_module.DatabaseError = DatabaseError
-        errors_module.DataError = DataError
-        errors_module.OperationalError = OperationalError
-        errors_module.IntegrityError = IntegrityError
-        errors_module.InternalError = InternalError
-        errors_module.ProgrammingError = ProgrammingError
-        errors_module.NotSupportedError = NotSupportedError
+        errors_module = ModuleType('errors')
         
-        # PostgreSQL-specific error classes (Django requirements)
-        errors_module.UniqueViolation = IntegrityError
-        errors_module.ForeignKeyViolation = IntegrityError
-        errors_module.CheckViolation = IntegrityError
-        errors_module.NotNullViolation = IntegrityError
-        errors_module.ExclusionViolation = IntegrityError
-        errors_module.InvalidTextRepresentation = DataError
-        errors_module.InvalidDatetimeFormat = DataError
-        errors_module.NumericValueOutOfRange = DataError
-        errors_module.DivisionByZero = DataError
-        errors_module.ConnectionDoesNotExist = OperationalError
-        errors_module.ConnectionException = OperationalError
-        errors_module.DeadlockDetected = OperationalError
-        errors_module.SerializationFailure = OperationalError
-        errors_module.SyntaxError = ProgrammingError
-        errors_module.UndefinedColumn = ProgrammingError
-        errors_module.UndefinedTable = ProgrammingError
-        errors_module.UndefinedFunction = ProgrammingError
-        errors_module.InsufficientPrivilege = OperationalError
+        errors_module.__dict__.update(exceptions)
+        errors_module.__dict__.update(
+            {alias: exceptions[base] for alias, base in _ERROR_ALIASES.items()}
+        )
         
         # Register errors module in psycopg2cffi namespace
         psycopg2cffi.errors = errors_module
-        sys.modules['psycopg2cffi.errors'] = errors_module
+        modules['psycopg2cffi.errors'] = errors_module
         
         # Register errors module in psycopg2 namespace
         psycopg2.errors = errors_module
-        sys.modules['psycopg2.errors'] = errors_module
+        modules['psycopg2.errors'] = errors_module
         
         # Register extensions module
         psycopg2cffi.extensions = extensions
-        sys.modules['psycopg2cffi.extensions'] = extensions
+        modules['psycopg2cffi.extensions'] = extensions
         psycopg2.extensions = extensions
-        sys.modules['psycopg2.extensions'] = extensions
+        modules['psycopg2.extensions'] = extensions
         
         # Register sql module
         psycopg2cffi.sql = sql
-        sys.modules['psycopg2cffi.sql'] = sql
+        modules['psycopg2cffi.sql'] = sql
         psycopg2.sql = sql
-        sys.modules['psycopg2.sql'] = sql
+        modules['psycopg2.sql'] = sql
         
         # Also add error classes as module-level attributes for backward compatibility
         if not hasattr(psycopg2, 'DatabaseError'):
-            psycopg2.Warning = Warning
-            psycopg2.Error = Error
-            psycopg2.InterfaceError = InterfaceError
-            psycopg2.DatabaseError = DatabaseError
-            psycopg2.DataError = DataError
-            psycopg2.OperationalError = OperationalError
-            psycopg2.IntegrityError = IntegrityError
-            psycopg2.InternalError = InternalError
-            psycopg2.ProgrammingError = ProgrammingError
-            psycopg2.NotSupportedError = NotSupportedError
+            psycopg2.__dict__.update(exceptions)
         
         # Patch Connection class to add 'info' attribute
         # Django's PostgreSQL backend expects connection.info.server_version
         from psycopg2cffi._impl.connection import Connection
         
-        if not hasattr(Connection, 'info'):
-            class ConnectionInfo:
-                """Mock ConnectionInfo object for psycopg2cffi compatibility"""
-                def __init__(self, connection):
-                    self._connection = connection
-                    self._params = {}
-                
-                @property
-                def server_version(self):
-                    """Get PostgreSQL server version"""
-                    try:
-                        # Get version from the connection
-                        cursor = self._connection.cursor()
-                        cursor.execute("SELECT version()")
-                        version_string = cursor.fetchone()[0]
-                        cursor.close()
-                        
-                        # Parse version number from string like "PostgreSQL 13.2..."
-                        import re
-                        match = re.search(r'PostgreSQL (\d+)\.(\d+)', version_string)
-                        if match:
-                            major = int(match.group(1))
-                            minor = int(match.group(2))
-                            # Return as integer: major * 10000 + minor * 100
-                            return major * 10000 + minor * 100
-                        return 130000  # Default to PostgreSQL 13.0
-                    except:
-                        return 130000  # Default to PostgreSQL 13.0
-                
-                def parameter_status(self, param_name):
-                    """Get connection parameter status (like TimeZone, client_encoding, etc.)"""
-                    try:
-                        cursor = self._connection.cursor()
-                        cursor.execute(f"SHOW {param_name}")
-                        result = cursor.fetchone()[0]
-                        cursor.close()
-                        return result
-                    except:
-                        # Return sensible defaults
-                        defaults = {
-                            'TimeZone': 'UTC',
-                            'client_encoding': 'UTF8',
-                            'server_encoding': 'UTF8',
-                            'server_version': '13.0',
-                        }
-                        return defaults.get(param_name, '')
-            
-            # Store original __init__
-            original_init = Connection.__init__
-            
-            def patched_init(self, *args, **kwargs):
-                """Patched __init__ to add info attribute"""
-                original_init(self, *args, **kwargs)
-                self.info = ConnectionInfo(self)
-            
-            # Apply patch
-            Connection.__init__ = patched_init
+        if not getattr(Connection, '_info_patched', False) and not hasattr(Connection, 'info'):
+            # Built on first access instead of in every Connection.__init__
+            Connection.info = property(_connection_info)
+            Connection._info_patched = True
         
+        psycopg2._cffi_compat_installed = True
         return True
         
     except ImportError as e:
@@ -2,32 +2,49 @@
 Simple test to verify chatbot can communicate with MCP server
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import sys
+
+# Shared session so the health check and queries reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+def _flush(out):
+    """Write a buffered section in one call instead of one write per line"""
+    sys.stdout.write('\n'.join(out) + '\n')
+    sys.stdout.flush()
+    out.clear()
 
 def test_chatbot_api():
     """Test the chatbot API endpoint"""
-    print("=" * 60)
-    print("🧪 Testing Chatbot API with MCP Integration")
-    print("=" * 60)
+    out = []
+    p = out.append
+    p("=" * 60)
+    p("🧪 Testing Chatbot API with MCP Integration")
+    p("=" * 60)
     
     base_url = "http://localhost:8001"
     
     # Test 1: Health check
-    print("\n1️⃣ Testing Health Endpoint...")
+    p("\n1️⃣ Testing Health Endpoint...")
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = SESSION.get(f"{base_url}/health", timeout=5)
         if response.status_code == 200:
-            print("   ✅ FastAPI service is running")
-            print(f"   📊 Response: {response.json()}")
+            p("   ✅ FastAPI service is running")
+            p(f"   📊 Response: {response.json()}")
         else:
-            print(f"   ❌ Health check failed: {response.status_code}")
+            p(f"   ❌ Health check failed: {response.status_code}")
     except Exception as e:
-        print(f"   ❌ Cannot connect to FastAPI service: {e}")
-        print("   💡 Make sure the service is running: cd backend/fastapi_service && python -m uvicorn main:app --host 0.0.0.0 --port 8001")
+        p(f"   ❌ Cannot connect to FastAPI service: {e}")
+        p("   💡 Make sure the service is running: cd backend/fastapi_service && python -m uvicorn main:app --host 0.0.0.0 --port 8001")
+        _flush(out)
         return
     
+    _flush(out)
+
     # Test 2: Send a query to chatbot
-    print("\n2️⃣ Testing Chatbot Query Processing...")
+    p("\n2️⃣ Testing Chatbot Query Processing...")
     try:
         query = "What is the average temperature in the Indian Ocean?"
         payload = {
@@ -35,8 +52,8 @@ def test_chatbot_api():
             "session_id": "test_session_001"
         }
         
-        print(f"   📤 Sending query: '{query}'")
-        response = requests.post(
+        p(f"   📤 Sending query: '{query}'")
+        response = SESSION.post(
             f"{base_url}/api/chat",
             json=payload,
             timeout=30
@@ -44,21 +61,23 @@ def test_chatbot_api():
         
         if response.status_code == 200:
             result = response.json()
-            print("   ✅ Chatbot responded successfully!")
-            print(f"\n   🤖 Response:")
-            print(f"   {result.get('response', 'No response')[:300]}...")
-            print(f"\n   📊 Metadata:")
-            print(f"   - Sources: {len(result.get('sources', []))}")
-            print(f"   - Confidence: {result.get('confidence', 0)}")
-            print(f"   - Data Source: {result.get('metadata', {}).get('data_source', 'unknown')}")
+            p("   ✅ Chatbot responded successfully!")
+            p(f"\n   🤖 Response:")
+            p(f"   {result.get('response', 'No response')[:300]}...")
+            p(f"\n   📊 Metadata:")
+            p(f"   - Sources: {len(result.get('sources', []))}")
+            p(f"   - Confidence: {result.get('confidence', 0)}")
+            p(f"   - Data Source: {result.get('metadata', {}).get('data_source', 'unknown')}")
         else:
-            print(f"   ❌ Query failed: {response.status_code}")
-            print(f"   Response: {response.text}")
+            p(f"   ❌ Query failed: {response.status_code}")
+            p(f"   Response: {response.text}")
     except Exception as e:
-        print(f"   ❌ Error during query: {e}")
+        p(f"   ❌ Error during query: {e}")
     
+    _flush(out)
+
     # Test 3: Test another query for statistics
-    print("\n3️⃣ Testing Statistics Query (MCP Tool)...")
+    p("\n3️⃣ Testing Statistics Query (MCP Tool)...")
     try:
         query = "Calculate temperature statistics for Indian Ocean"
         payload = {
@@ -66,8 +85,8 @@ def test_chatbot_api():
             "session_id": "test_session_002"
         }
         
-        print(f"   📤 Sending query: '{query}'")
-        response = requests.post(
+        p(f"   📤 Sending query: '{query}'")
+        response = SESSION.post(
             f"{base_url}/api/chat",
             json=payload,
             timeout=30
@@ -75,21 +94,22 @@ def test_chatbot_api():
         
         if response.status_code == 200:
             result = response.json()
-            print("   ✅ Statistics query processed!")
-            print(f"\n   🤖 Response preview:")
-            print(f"   {result.get('response', 'No response')[:200]}...")
+            p("   ✅ Statistics query processed!")
+            p(f"\n   🤖 Response preview:")
+            p(f"   {result.get('response', 'No response')[:200]}...")
         else:
-            print(f"   ❌ Query failed: {response.status_code}")
+            p(f"   ❌ Query failed: {response.status_code}")
     except Exception as e:
-        print(f"   ❌ Error during query: {e}")
+        p(f"   ❌ Error during query: {e}")
     
-    print("\n" + "=" * 60)
-    print("✅ Chatbot API Test Complete!")
-    print("=" * 60)
-    print("\n📝 Conclusions:")
-    print("   • If queries succeeded, MCP is integrated with chatbot")
-    print("   • Check response metadata for 'data_source': 'neon_cloud_db'")
-    print("   • MCP tools provide statistical analysis")
+    p("\n" + "=" * 60)
+    p("✅ Chatbot API Test Complete!")
+    p("=" * 60)
+    p("\n📝 Conclusions:")
+    p("   • If queries succeeded, MCP is integrated with chatbot")
+    p("   • Check response metadata for 'data_source': 'neon_cloud_db'")
+    p("   • MCP tools provide statistical analysis")
+    _flush(out)
 
 if __name__ == "__main__":
     test_chatbot_api()
@@ -0,0 +1,24 @@
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonEncoder(DjangoJSONEncoder):
+    """JSON encoder backed by orjson, falling back to DjangoJSONEncoder for
+    types orjson does not handle natively (Decimal, Promise, ...)
+
+    Non-string dict keys are stringified and datetimes are passed through to
+    DjangoJSONEncoder.default, so stored values match the stdlib encoder's.
+    """
+
+    def encode(self, o):
+        if orjson is None:
+            return super().encode(o)
+        return orjson.dumps(
+            o,
+            default=self.default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode()
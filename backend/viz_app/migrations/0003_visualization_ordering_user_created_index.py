@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viz_app", "0002_alter_visualization_dataset"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="visualization",
+            options={"ordering": ["-created_at", "-id"]},
+        ),
+        migrations.AddIndex(
+            model_name="visualization",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"], name="viz_user_created_idx"
+            ),
+        ),
+    ]
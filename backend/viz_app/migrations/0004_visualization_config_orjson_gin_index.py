@@ -0,0 +1,34 @@
+from django.db import migrations, models
+import viz_app.encoders
+
+
+def add_config_gin_index(apps, schema_editor):
+    # GIN indexes are PostgreSQL-only; the SQLite fallback database skips it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS viz_config_gin_idx "
+        "ON viz_app_visualization USING gin (config jsonb_path_ops)"
+    )
+
+
+def remove_config_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS viz_config_gin_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("viz_app", "0003_visualization_ordering_user_created_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="visualization",
+            name="config",
+            field=models.JSONField(encoder=viz_app.encoders.OrjsonEncoder),
+        ),
+        migrations.RunPython(add_config_gin_index, remove_config_gin_index),
+    ]
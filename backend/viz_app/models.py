@@ -1,14 +1,25 @@
 from django.db import models
 from auth_app.models import CustomUser
 from dataset_app.models import NetCDFDataset
+from .encoders import OrjsonEncoder
 
 class Visualization(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     dataset = models.ForeignKey(NetCDFDataset, on_delete=models.CASCADE)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
-    config = models.JSONField()
+    config = models.JSONField(encoder=OrjsonEncoder)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # id breaks created_at ties so cursor pages never skip or repeat rows
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # Per-user listing, newest first
+            models.Index(fields=['user', '-created_at', '-id'], name='viz_user_created_idx'),
+        ]
+        # config also has a GIN (jsonb_path_ops) index for config__contains
+        # lookups, created in migration 0004 on PostgreSQL only
+
     def __str__(self):
         return self.name
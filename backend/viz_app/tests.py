@@ -1,3 +1,85 @@
+import json
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from auth_app.models import CustomUser
+from dataset_app.models import NetCDFDataset
+from .encoders import OrjsonEncoder
+from .models import Visualization
+
+
+class VisualizationListCacheTests(TestCase):
+    url = '/viz/visualizations/'
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='viz_user', password='pw')
+        self.dataset = NetCDFDataset.objects.create(filename='argo.nc', uploaded_by=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _names(self, response):
+        self.assertEqual(response.status_code, 200)
+        return [item['name'] for item in response.data['results']]
+
+    def test_list_is_served_from_cache(self):
+        self.assertEqual(self._names(self.client.get(self.url)), [])
+
+        # Written behind the view's back - the cached page is still served
+        Visualization.objects.create(user=self.user, dataset=self.dataset, name='direct', config={})
+        self.assertEqual(self._names(self.client.get(self.url)), [])
+
+    def test_create_invalidates_cached_list(self):
+        self.assertEqual(self._names(self.client.get(self.url)), [])
+
+        response = self.client.post(self.url, {
+            'user': self.user.pk,
+            'dataset': str(self.dataset.pk),
+            'name': 'Surface temperature',
+            'config': {'type': 'map'},
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        self.assertEqual(self._names(self.client.get(self.url)), ['Surface temperature'])
+
+    def test_cache_is_keyed_per_user(self):
+        Visualization.objects.create(user=self.user, dataset=self.dataset, name='mine', config={})
+        self.assertEqual(self._names(self.client.get(self.url)), ['mine'])
+
+        other = CustomUser.objects.create_user(username='other_user', password='pw')
+        Visualization.objects.create(user=other, dataset=self.dataset, name='theirs', config={})
+        other_client = APIClient()
+        other_client.force_authenticate(other)
+
+        # Each user sees only their own rows, never another user's cached page
+        self.assertEqual(self._names(other_client.get(self.url)), ['theirs'])
+        self.assertEqual(self._names(self.client.get(self.url)), ['mine'])
+
+    def test_anonymous_requests_are_rejected(self):
+        response = APIClient().get(self.url)
+        self.assertIn(response.status_code, (401, 403))
+
+
+class OrjsonEncoderTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='viz_user', password='pw')
+        self.dataset = NetCDFDataset.objects.create(filename='argo.nc', uploaded_by=self.user)
+
+    def test_config_with_int_keys_round_trips(self):
+        viz = Visualization.objects.create(
+            user=self.user, dataset=self.dataset, name='levels',
+            config={'levels': {10: 'surface', 2000: 'deep'}, 'scale': {0.5: 'half'}}
+        )
+        viz.refresh_from_db()
+
+        # Stringified exactly as the stdlib json encoder does
+        self.assertEqual(viz.config, {'levels': {'10': 'surface', '2000': 'deep'}, 'scale': {'0.5': 'half'}})
 
-# Create your tests here.
+    def test_datetime_format_matches_django_encoder(self):
+        value = {'at': datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc)}
+        self.assertEqual(json.loads(OrjsonEncoder().encode(value)),
+                         json.loads(DjangoJSONEncoder().encode(value)))
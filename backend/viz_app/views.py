@@ -1,7 +1,70 @@
+import time
+from django.core.cache import cache
 from rest_framework import viewsets
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from .models import Visualization
 from .serializers import VisualizationSerializer
 
+# Serialized list pages are cached until a write bumps the version (or the
+# timeout passes - the default locmem cache is per-process)
+LIST_CACHE_TIMEOUT = 60
+LIST_CACHE_VERSION_KEY = 'viz_app:visualization_list:version'
+
+class VisualizationCursorPagination(CursorPagination):
+    # Seeks on (created_at, id) instead of OFFSET scans as the table grows;
+    # id makes the cursor position unique when timestamps collide
+    page_size = 50
+    ordering = ('-created_at', '-id')
+
 class VisualizationViewSet(viewsets.ModelViewSet):
-    queryset = Visualization.objects.all()
+    # Load only the columns the serializer emits - the FKs are rendered as
+    # primary keys straight from user_id/dataset_id, so no JOIN is needed
+    queryset = Visualization.objects.only(
+        'id', 'user_id', 'dataset_id', 'name', 'description', 'config', 'created_at'
+    )
     serializer_class = VisualizationSerializer
+    pagination_class = VisualizationCursorPagination
+    permission_classes = [IsAuthenticated]  # Visualizations are private to their owner
+
+    def get_queryset(self):
+        # Scoped to the requesting user - the list is then served by
+        # viz_user_created_idx (user, -created_at, -id)
+        return super().get_queryset().filter(user=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        version = self._list_cache_version()
+        # The queryset is per user (and requires auth), so the key is too; the full
+        # path keeps each cursor page and query string separate
+        key = f'viz_app:visualization_list:{version}:{request.user.pk}:{request.get_full_path()}'
+
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, LIST_CACHE_TIMEOUT)
+        return Response(data)
+
+    def _list_cache_version(self):
+        # Seeded from the clock, so a version that was evicted and re-created
+        # is always newer than any page cached under the old counter
+        cache.add(LIST_CACHE_VERSION_KEY, time.time_ns(), None)
+        return cache.get(LIST_CACHE_VERSION_KEY)
+
+    def _invalidate_list_cache(self):
+        try:
+            cache.incr(LIST_CACHE_VERSION_KEY)
+        except ValueError:
+            cache.set(LIST_CACHE_VERSION_KEY, time.time_ns(), None)
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+        self._invalidate_list_cache()
+
+    def perform_update(self, serializer):
+        serializer.save(user=self.request.user)
+        self._invalidate_list_cache()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        self._invalidate_list_cache()